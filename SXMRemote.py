@@ -19,6 +19,9 @@
 # changed by Falk mailbox@anfatec.de
 
 import ctypes
+import logging
+import os
+import queue
 import threading
 import time
 #import win32event
@@ -29,6 +32,9 @@ from ctypes import POINTER, byref, c_ulong
 from ctypes.wintypes import BOOL, HWND, MSG, UINT
 from ctypes import byref, create_string_buffer
 import configparser
+from concurrent.futures import Future
+
+logger = logging.getLogger(__name__)
 
 # DECLARE_HANDLE(name) typedef void *name;
 HCONV     = c_void_p  # = DECLARE_HANDLE(HCONV)
@@ -110,36 +116,78 @@ XTYP_SHIFT           = 4
 
 TIMEOUT_ASYNC        = 0xFFFFFFFF
 
-def get_winfunc(libname, funcname, restype=None, argtypes=(), _libcache={}):
-    """Retrieve a function from a library, and set the data types."""
-    from ctypes import windll
+# Single user32 handle shared by every binding below
+_user32 = ctypes.WinDLL("user32", use_last_error=True)
 
-    if libname not in _libcache:
-        _libcache[libname] = windll.LoadLibrary(libname)
-    func = getattr(_libcache[libname], funcname)
+def _bind(dll, funcname, argtypes, restype):
+    """Retrieve a function from a loaded library, and set the data types."""
+    func = getattr(dll, funcname)
     func.argtypes = argtypes
     func.restype = restype
-
     return func
 
 
+# DdeInitialize expects a CALLBACK (stdcall) function, so this must stay WINFUNCTYPE.
+# Only the single thunk wrapping DDEClient._callback crosses the ctypes boundary;
+# everything dispatched from there is plain Python.
 DDECALLBACK = WINFUNCTYPE(HDDEDATA, UINT, UINT, HCONV, HSZ, HSZ, HDDEDATA, 
                           ULONG_PTR, ULONG_PTR)
 
 class DDE(object):
     """Object containing all the DDE functions"""
-    AccessData         = get_winfunc("user32", "DdeAccessData",          LPBYTE,   (HDDEDATA, LPDWORD))
-    ClientTransaction  = get_winfunc("user32", "DdeClientTransaction",   HDDEDATA, (LPBYTE, DWORD, HCONV, HSZ, UINT, UINT, DWORD, LPDWORD))
-    Connect            = get_winfunc("user32", "DdeConnect",             HCONV,    (DWORD, HSZ, HSZ, PCONVCONTEXT))
-    CreateStringHandle = get_winfunc("user32", "DdeCreateStringHandleW", HSZ,      (DWORD, LPCWSTR, UINT))
-    Disconnect         = get_winfunc("user32", "DdeDisconnect",          BOOL,     (HCONV,))
-    GetLastError       = get_winfunc("user32", "DdeGetLastError",        UINT,     (DWORD,))
-    Initialize         = get_winfunc("user32", "DdeInitializeW",         UINT,     (LPDWORD, DDECALLBACK, DWORD, DWORD))
-    FreeDataHandle     = get_winfunc("user32", "DdeFreeDataHandle",      BOOL,     (HDDEDATA,))
-    FreeStringHandle   = get_winfunc("user32", "DdeFreeStringHandle",    BOOL,     (DWORD, HSZ))
-    QueryString        = get_winfunc("user32", "DdeQueryStringA",        DWORD,    (DWORD, HSZ, LPSTR, DWORD, c_int))
-    UnaccessData       = get_winfunc("user32", "DdeUnaccessData",        BOOL,     (HDDEDATA,))
-    Uninitialize       = get_winfunc("user32", "DdeUninitialize",        BOOL,     (DWORD,))
+    AccessData         = _bind(_user32, "DdeAccessData",          (HDDEDATA, LPDWORD), LPBYTE)
+    ClientTransaction  = _bind(_user32, "DdeClientTransaction",   (LPBYTE, DWORD, HCONV, HSZ, UINT, UINT, DWORD, LPDWORD), HDDEDATA)
+    Connect            = _bind(_user32, "DdeConnect",             (DWORD, HSZ, HSZ, PCONVCONTEXT), HCONV)
+    CreateStringHandle = _bind(_user32, "DdeCreateStringHandleW", (DWORD, LPCWSTR, UINT), HSZ)
+    Disconnect         = _bind(_user32, "DdeDisconnect",          (HCONV,), BOOL)
+    GetLastError       = _bind(_user32, "DdeGetLastError",        (DWORD,), UINT)
+    Initialize         = _bind(_user32, "DdeInitializeW",         (LPDWORD, DDECALLBACK, DWORD, DWORD), UINT)
+    FreeDataHandle     = _bind(_user32, "DdeFreeDataHandle",      (HDDEDATA,), BOOL)
+    FreeStringHandle   = _bind(_user32, "DdeFreeStringHandle",    (DWORD, HSZ), BOOL)
+    QueryString        = _bind(_user32, "DdeQueryStringA",        (DWORD, HSZ, LPSTR, DWORD, c_int), DWORD)
+    UnaccessData       = _bind(_user32, "DdeUnaccessData",        (HDDEDATA,), BOOL)
+    Uninitialize       = _bind(_user32, "DdeUninitialize",        (DWORD,), BOOL)
+
+# Windows message loop functions, resolved once at import instead of on every loop() call
+LPMSG   = POINTER(MSG)
+LRESULT = c_ulong
+
+_GetMessageW      = _bind(_user32, "GetMessageW",      (LPMSG, HWND, UINT, UINT), BOOL)
+_TranslateMessage = _bind(_user32, "TranslateMessage", (LPMSG,), BOOL)
+_DispatchMessageW = _bind(_user32, "DispatchMessageW", (LPMSG,), LRESULT)
+_PeekMessageW     = _bind(_user32, "PeekMessageW",     (LPMSG, HWND, UINT, UINT, UINT), BOOL)
+
+PM_REMOVE = 0x0001
+
+# Slice (ms) used when blocking for a DDE answer; the answer flag is re-checked after each slice
+ANSWER_WAIT_SLICE = 100
+
+# Translation table turning a decimal comma into a dot in raw DDE answers
+_COMMA_TO_DOT = bytes.maketrans(b',', b'.')
+
+def _parse_float_answer(raw):
+    """Parse the number on the second line of a raw DDE answer, or return None."""
+    start = raw.find(b'\r\n')  # End of the echoed first line
+    if start < 0:
+        return None  # Return None if no valid value
+    start += 2
+    end = raw.find(b'\r\n', start)
+    NrStr = raw[start:] if end < 0 else raw[start:end]
+    return float(NrStr.translate(_COMMA_TO_DOT))  # Replace comma with dot and convert to float
+
+# One MSG structure per thread, reused by that thread's message pump iterations.
+# Pumps run on several threads (MyMsgClass, the DDE worker, callers of pump()),
+# so a single shared MSG would be overwritten while another thread dispatches it.
+_tls = threading.local()
+
+def _thread_lpmsg():
+    """Return a pointer to the calling thread's MSG structure."""
+    try:
+        return _tls.lpmsg
+    except AttributeError:
+        _tls.msg = MSG()
+        _tls.lpmsg = byref(_tls.msg)
+        return _tls.lpmsg
 
 class DDEError(RuntimeError):
     """Exception raise when a DDE errpr occures."""
@@ -156,6 +204,10 @@ class DDEClient(object):
     service/topic. To handle callbacks, subclass DDEClient and override the callback method.
     """
 
+    # UTF-16LE encoded envelope of the Pascal-style program sent by execute()
+    _EXEC_PREFIX = 'begin\r\n  '.encode('utf-16-le')
+    _EXEC_SUFFIX = '\r\nend.\r\n'.encode('utf-16-le')
+
     def __init__(self, service, topic):
         """
         Initialize a connection to a DDE service/topic.
@@ -169,141 +221,269 @@ class DDEClient(object):
         # Initialize instance variables
         self._idInst = DWORD(0)  # DDE instance identifier
         self._hConv = HCONV()    # Handle to the DDE conversation
-
-        # Set up the callback function for DDE events
-        self._callback = DDECALLBACK(self._callback)
+        self._hsz_cache = {}     # Item name -> string handle, kept for the client lifetime
+        self._pending_xact = 0   # Asynchronous transactions not yet confirmed
+
+        # DDE event type -> handler, used by _callback to dispatch in one lookup
+        self._cb_table = {
+            XTYP_XACT_COMPLETE: self._on_xact_complete,
+            XTYP_DISCONNECT: self._on_disconnect,
+            XTYP_ADVDATA: self._on_advdata,
+        }
+
+        # Per-instance references to the DDE functions used on every transaction
+        self._ClientTransaction = DDE.ClientTransaction
+        self._AccessData = DDE.AccessData
+        self._UnaccessData = DDE.UnaccessData
+        self._FreeDataHandle = DDE.FreeDataHandle
+        self._QueryString = DDE.QueryString
+
+        # Set up the callback function for DDE events. The thunk is created once and
+        # kept alive on the instance: DDEML calls it until Uninitialize, and a
+        # garbage-collected thunk would crash the process.
+        self._callback_ref = DDECALLBACK(self._callback)
 
         # Initialize the DDEML (Dynamic Data Exchange Management Library)
-        res = DDE.Initialize(byref(self._idInst), self._callback, 0x00000010, 0)
+        res = DDE.Initialize(byref(self._idInst), self._callback_ref, 0x00000010, 0)
         if res != DMLERR_NO_ERROR:
             raise DDEError(f"Unable to register with DDEML (err={hex(res)})")
 
         # Create string handles for the service and topic
         hszService = DDE.CreateStringHandle(self._idInst, service, 1200)
-        hszTopic = DDE.CreateStringHandle(self._idInst, topic, 1200)
+        self._hszTopic = DDE.CreateStringHandle(self._idInst, topic, 1200)  # Kept until __del__
 
         # Establish a conversation with the DDE server
-        self._hConv = DDE.Connect(self._idInst, hszService, hszTopic, PCONVCONTEXT())
+        self._hConv = DDE.Connect(self._idInst, hszService, self._hszTopic, PCONVCONTEXT())
         
-        # Free the string handles after use
-        DDE.FreeStringHandle(self._idInst, hszTopic)
+        # Free the service handle after use
         DDE.FreeStringHandle(self._idInst, hszService)
 
         # Raise an error if the conversation could not be established
         if not self._hConv:
             raise DDEError("Unable to establish a conversation with server", self._idInst)
 
-        # Set up advisory links for specific topics
-        self.advise("Scan")
-        self.advise("Command")
-        self.advise("SaveFileName")
-        self.advise("ScanLine")
-        self.advise("MicState")
-        self.advise("SpectSave")
+        # Advise item name -> handler, used by callback() to dispatch in one lookup
+        # (b'Scan' stays last so the prefix fallback never shadows b'ScanLine')
+        self._advise_table = {
+            b'Command': self._handle_command,
+            b'SaveFileName': self._handle_savefilename,
+            b'ScanLine': self._handle_scanline,
+            b'MicState': self.MicState,
+            b'SpectSave': self.SpectSave,
+            b'Scan': self._handle_scan_state,
+        }
 
         # Initialize configuration parser
         self.config = configparser.ConfigParser()
+        self._ini_name = None   # (IniName, timestamp) of the last IniFileName request
+        self._ini_cache = None  # (IniName, mtime_ns, {(section, item): value}) for the current INI file, parsed into self.config
 
         # Initialize variables for tracking responses
         self.NotGotAnswer = False  # Flag to indicate if an answer was received
         self.LastAnswer = ""       # Stores the last received answer
 
+        # Short-lived cache of GetScanPara/GetFeedbackPara answers: key -> (value, timestamp)
+        self._para_cache = {}
+        self._para_ttl = 0.05  # seconds
+
+        # Reusable buffer receiving the item name of each advise event
+        self._item_buf_size = 128
+        self._item_buf = create_string_buffer(self._item_buf_size)
+
+        # Reusable buffer holding the encoded command passed to execute()
+        self._set_exec_buf(4096)
+
+        # Auto-reset event signaled by _callback when an answer arrives
+        self._answer_event = win32event.CreateEvent(None, False, False, None)
+        self._answer_cv = threading.Condition()  # Same signal for threads that cannot pump
+        self._owner_thread = threading.get_ident()  # Thread receiving the DDEML callbacks
+
+        # Set up advisory links for specific topics, posted as one batch
+        self.advise_many(("Scan", "Command", "SaveFileName", "ScanLine", "MicState", "SpectSave"))
+
         
-    def __del__(self):
-        """Cleanup any active connections."""
+    def close(self):
+        """
+        Disconnect and uninitialize the DDE instance.
+
+        Call it on the thread that created the client: DDEML instances are bound
+        to that thread. Safe to call more than once.
+        """
         if self._hConv:
             DDE.Disconnect(self._hConv)  # Disconnect from the DDE conversation
+            self._hConv = HCONV()
+        for hsz in self._hsz_cache.values():
+            DDE.FreeStringHandle(self._idInst, hsz)  # Free the cached item string handles
+        self._hsz_cache.clear()
+        if getattr(self, '_hszTopic', None):
+            DDE.FreeStringHandle(self._idInst, self._hszTopic)  # Free the retained topic handle
+            self._hszTopic = None
         if self._idInst:
             DDE.Uninitialize(self._idInst)  # Uninitialize the DDE instance
+            self._idInst = DWORD(0)
+
+    def __del__(self):
+        """Cleanup any active connections (no-op if close() already ran)."""
+        self.close()
+
+    def _hsz(self, item):
+        """Return the cached string handle for an item, creating it on first use."""
+        hsz = self._hsz_cache.get(item)
+        if hsz is None:
+            hsz = DDE.CreateStringHandle(self._idInst, item, 1200)  # Create a string handle for the item
+            self._hsz_cache[item] = hsz
+        return hsz
 
     def advise(self, item, stop=False):
         """Request updates when DDE data changes."""
 
-        hszItem = DDE.CreateStringHandle(self._idInst, item, 1200)  # Create a string handle for the item
-        hDdeData = DDE.ClientTransaction(LPBYTE(), 0, self._hConv, hszItem, CF_TEXT, 
+        hDdeData = self._ClientTransaction(LPBYTE(), 0, self._hConv, self._hsz(item), CF_TEXT, 
                                          XTYP_ADVSTOP if stop else XTYP_ADVSTART, TIMEOUT_ASYNC, LPDWORD())
-        DDE.FreeStringHandle(self._idInst, hszItem)  # Free the string handle after use
         if not hDdeData:
             raise DDEError("Unable to %s advise" % ("stop" if stop else "start"), self._idInst)
-        DDE.FreeDataHandle(hDdeData)  # Free the data handle
+        self._FreeDataHandle(hDdeData)  # Free the data handle
+
+    def advise_many(self, items, timeout=1000):
+        """Start advise links for several items, then wait once for all confirmations."""
+        for item in items:
+            hDdeData = self._ClientTransaction(LPBYTE(), 0, self._hConv, self._hsz(item), CF_TEXT,
+                                             XTYP_ADVSTART, TIMEOUT_ASYNC, LPDWORD())
+            if not hDdeData:
+                raise DDEError("Unable to start advise", self._idInst)
+            self._pending_xact += 1
+
+        # Drain the XTYP_XACT_COMPLETE confirmations in a single wait loop
+        deadline = time.monotonic() + timeout / 1000.0
+        while self._pending_xact > 0:
+            remaining = int((deadline - time.monotonic()) * 1000)
+            if remaining <= 0:
+                break  # Confirmations will still be handled by later message pumps
+            res = win32event.MsgWaitForMultipleObjects(
+                [self._answer_event], False, remaining, win32event.QS_ALLINPUT)
+            if res == win32event.WAIT_OBJECT_0 + 1:
+                pump()
+        self._pending_xact = 0
+
+    def _set_exec_buf(self, size):
+        """Allocate the execute() buffer and a writable byte view onto it."""
+        self._exec_buf = (ctypes.c_char * size)()
+        self._exec_view = memoryview(self._exec_buf).cast('B')
 
     def execute(self, command, timeout=5000):
         """Execute a DDE command."""
         self.NotGotAnswer = True  # Flag to indicate if an answer was received
-        command = f'begin\r\n  {command}\r\nend.\r\n'  # Create a Pascal-style program
-        command = bytes(command, 'utf-16').strip(b"\xff").strip(b"\xfe")  # Convert to bytes and clean up
-        pData = c_char_p(command)
-        cbData = DWORD(len(command) + 1)
-        hDdeData = DDE.ClientTransaction(pData, cbData, self._hConv, HSZ(), CF_TEXT, XTYP_EXECUTE, timeout, LPDWORD())
+        win32event.ResetEvent(self._answer_event)  # Drop any stale answer signal
+        payload = self._EXEC_PREFIX + command.encode('utf-16-le') + self._EXEC_SUFFIX  # Pascal-style program, no BOM
+        size = len(payload)
+        if size >= len(self._exec_buf):
+            self._set_exec_buf(size + 1)  # Grow the reusable buffer for long commands
+        self._exec_view[:size] = payload  # Copy into the reusable buffer
+        self._exec_view[size] = 0  # Terminate as c_char_p would
+        hDdeData = self._ClientTransaction(self._exec_buf, size + 1, self._hConv, HSZ(), CF_TEXT, XTYP_EXECUTE, timeout, LPDWORD())
         if not hDdeData:
             raise DDEError("Unable to send command", self._idInst)
-        DDE.FreeDataHandle(hDdeData)  # Free the data handle
+        self._FreeDataHandle(hDdeData)  # Free the data handle
 
     def request(self, item, timeout=5000):
         """Request data from DDE service."""
 
-        hszItem = DDE.CreateStringHandle(self._idInst, item, 1200)  # Create a string handle for the item
-        hDdeData = DDE.ClientTransaction(LPBYTE(), 0, self._hConv, hszItem, CF_TEXT, XTYP_REQUEST, timeout, LPDWORD())
-        DDE.FreeStringHandle(self._idInst, hszItem)  # Free the string handle after use
+        hDdeData = self._ClientTransaction(LPBYTE(), 0, self._hConv, self._hsz(item), CF_TEXT, XTYP_REQUEST, timeout, LPDWORD())
         if not hDdeData:
             raise DDEError("Unable to request item", self._idInst)
 
         if timeout != TIMEOUT_ASYNC:
             pdwSize = DWORD(0)
-            pData = DDE.AccessData(hDdeData, byref(pdwSize))  # Access the data
+            pData = self._AccessData(hDdeData, byref(pdwSize))  # Access the data
             if not pData:
-                DDE.FreeDataHandle(hDdeData)
+                self._FreeDataHandle(hDdeData)
                 raise DDEError("Unable to access data", self._idInst)
-            DDE.UnaccessData(hDdeData)  # Unaccess the data
+            self._UnaccessData(hDdeData)  # Unaccess the data
         else:
             pData = None
-        DDE.FreeDataHandle(hDdeData)  # Free the data handle
+        self._FreeDataHandle(hDdeData)  # Free the data handle
         return pData  # Return the requested data
 
     def callback(self, value, item=None):
         """Callback function for advice."""
         self.LastAnswer = value  # Store the last answer received
+        handler = self._advise_table.get(item)  # Exact item name, the common case
+        if handler is None:
+            for prefix, func in self._advise_table.items():
+                if item.startswith(prefix):
+                    handler = func
+                    break
+            else:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Unknown callback %s: %s", item, value)  # Handle unknown callback
+                return
+        handler(value)
+
+    def _handle_scan_state(self, value):
+        """Handle scan on/off advise."""
+        self.invalidate_para()  # Parameters may have changed
         if value.startswith(b'Scan on'):
             self.LastAnswer = 1
             self.ScanOnCallBack()  # Handle scan on callback
         elif value.startswith(b'Scan off'):
             self.LastAnswer = 0
             self.ScanOffCallBack()  # Handle scan off callback
-        elif item.startswith(b'SaveFileName'):
-            FileName = str(value, 'utf-8').strip('\r\n')
-            self.SaveIsDone(FileName)  # Handle save completion
-        elif item.startswith(b'ScanLine'):
-            value = str(value, 'utf-8').strip('\r\n')
-            self.Scan(value)  # Handle scan line
-        elif item.startswith(b'MicState'):
-            self.MicState(value)  # Handle microphone state
-        elif item.startswith(b'SpectSave'):
-            self.SpectSave(value)  # Handle spectrum save
-        elif item.startswith(b'Command'):
-            self.LastAnswer = value  # Echo of command
         else:
-            print("Unknown callback %s: %s" % (item, value))  # Handle unknown callback
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Unknown callback %s: %s", b'Scan', value)  # Handle unknown callback
+
+    def _handle_savefilename(self, value):
+        """Handle save completion advise."""
+        FileName = str(value, 'utf-8').strip('\r\n')
+        self.SaveIsDone(FileName)  # Handle save completion
+
+    def _handle_scanline(self, value):
+        """Handle scan line advise."""
+        value = str(value, 'utf-8').strip('\r\n')
+        self.Scan(value)  # Handle scan line
+
+    def _handle_command(self, value):
+        """Handle command echo advise."""
+        # No invalidate_para() here: this echo also carries GetPara's own answers,
+        # so clearing on it would empty the cache on every read. Real writes
+        # (SendWait) and scan on/off invalidate; the TTL covers changes in SXM.
+        self.LastAnswer = value  # Echo of command
 
     def _callback(self, wType, uFmt, hConv, hsz1, hsz2, hDdeData, dwData1, dwData2):
         """Handle DDE callback events."""
-        if wType == XTYP_XACT_COMPLETE:
-            pass  # Transaction complete
-        elif wType == XTYP_DISCONNECT:
-            print('disconnect')  # Handle disconnection
-        elif wType == XTYP_ADVDATA:
-
-            dwSize = DWORD(0)
-            pData = DDE.AccessData(hDdeData, byref(dwSize))  # Access the data
-            if pData:
-                item = create_string_buffer(128)  # Create a buffer for the item
-                DDE.QueryString(self._idInst, hsz2, item, 128, 1004)  # Query the item string
-                self.callback(pData, item.value)  # Call the callback function
+        return self._cb_table.get(wType, self._on_unknown)(wType, hsz2, hDdeData)
+
+    def _on_xact_complete(self, wType, hsz2, hDdeData):
+        """Handle transaction complete events."""
+        if self._pending_xact > 0:
+            self._pending_xact -= 1  # One asynchronous transaction confirmed
+        return 0  # Transaction complete
+
+    def _on_disconnect(self, wType, hsz2, hDdeData):
+        """Handle disconnection events."""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("disconnect")  # Handle disconnection
+        return 0
+
+    def _on_advdata(self, wType, hsz2, hDdeData):
+        """Handle advise data events."""
+        dwSize = DWORD(0)
+        pData = self._AccessData(hDdeData, byref(dwSize))  # Access the data
+        if pData:
+            item = self._item_buf  # Reuse the per-client item buffer
+            item[0] = b'\x00'
+            self._QueryString(self._idInst, hsz2, item, self._item_buf_size, 1004)  # Query the item string
+            self.callback(pData, item.value)  # Call the callback function
+            with self._answer_cv:
                 self.NotGotAnswer = False  # Reset the answer flag
-                DDE.UnaccessData(hDdeData)  # Unaccess the data
-            return DDE_FACK  # Acknowledge the data
-        else:
-            print('callback' + hex(wType))  # Handle other callback types
-
+                self._answer_cv.notify_all()  # Wake up waiters on other threads
+            win32event.SetEvent(self._answer_event)  # Wake up WaitAnswer
+            self._UnaccessData(hDdeData)  # Unaccess the data
+        return DDE_FACK  # Acknowledge the data
+
+    def _on_unknown(self, wType, hsz2, hDdeData):
+        """Handle other callback types."""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("callback %s", hex(wType))  # Handle other callback types
         return 0  # Default return value
 
     def ScanOnCallBack(self):
@@ -335,60 +515,110 @@ class DDEClient(object):
         MsgLoop = MyMsgClass()
         MsgLoop.start()
 
+    def GetIniFileName(self):
+        """Return the current INI file name, re-requested at most once per second."""
+        now = time.monotonic()
+        if self._ini_name is None or now - self._ini_name[1] >= 1.0:
+            IniName = self.request('IniFileName')  # Get the current INI file name
+            IniName = str(IniName, 'utf-8').strip('\r\n')  # Convert to string and clean up
+            self._ini_name = (IniName, now)
+        return self._ini_name[0]
+
     def GetIniEntry(self, section, item):
         """Retrieve a value from the INI configuration file."""
-        IniName = self.request('IniFileName')  # Get the current INI file name
-        IniName = str(IniName, 'utf-8').strip('\r\n')  # Convert to string and clean up
-        self.config.read(IniName)  # Read the INI file
-        val = self.config.get(section, item)  # Get the value from the specified section and item
+        IniName = self.GetIniFileName()
+        mtime = os.stat(IniName).st_mtime_ns
+        if self._ini_cache is None or self._ini_cache[:2] != (IniName, mtime):
+            # Only re-parse the INI file when it changed; forget all looked-up entries
+            config = configparser.ConfigParser()
+            config.read(IniName)
+            self.config = config
+            self._ini_cache = (IniName, mtime, {})
+        entries = self._ini_cache[2]
+        val = entries.get((section, item))
+        if val is None:
+            val = self.config.get(section, item)  # Get the value from the specified section and item
+            entries[(section, item)] = val
         return val
 
+    def WaitAnswer(self, timeout=None):
+        """Block until the answer to the last command has arrived.
+
+        On the thread that owns the conversation, sleep in MsgWaitForMultipleObjects
+        until either the answer event is signaled or a window message needs pumping
+        (the DDEML callback is only delivered while messages are dispatched).
+        Any other thread cannot pump for this client and simply waits on the
+        answer condition variable.
+
+        Returns True if the answer arrived, False if `timeout` (s) expired first.
+        """
+        if threading.get_ident() != self._owner_thread:
+            with self._answer_cv:
+                return self._answer_cv.wait_for(lambda: not self.NotGotAnswer, timeout)
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.NotGotAnswer:
+            wait_ms = ANSWER_WAIT_SLICE
+            if deadline is not None:
+                wait_ms = min(wait_ms, int((deadline - time.monotonic()) * 1000))
+                if wait_ms <= 0:
+                    return False
+            res = win32event.MsgWaitForMultipleObjects(
+                [self._answer_event], False, wait_ms, win32event.QS_ALLINPUT)
+            if res == win32event.WAIT_OBJECT_0:
+                break  # Answer arrived
+            # New input or a timed-out slice: QS_ALLINPUT only reports input that
+            # arrived since the queue was last checked, so messages already seen
+            # (but not yet removed) wake nothing; pump them on every timeout too.
+            pump()  # Dispatch pending messages, may trigger _callback
+        return True
+
     def GetChannel(self, ch):
         """Get the value of a specific channel."""
         string = f"a:=GetChannel({ch});\r\n  writeln(a);"  # Create the command string
         self.execute(string, 1000)  # Execute the command
 
-        while self.NotGotAnswer:
-            loop()  # Wait for the answer
-
-        BackStr = self.LastAnswer  # Get the last answer
-        BackStr = str(BackStr, 'utf-8').split('\r\n')  # Convert to string and split
-        if len(BackStr) >= 2:
-            NrStr = BackStr[1].replace(',', '.')  # Replace comma with dot
-            val = float(NrStr)  # Convert to float
-            return val  # Return the value
-        return None  # Return None if no valid value
+        self.WaitAnswer()  # Wait for the answer
+
+        return _parse_float_answer(self.LastAnswer)  # Return the value, or None if no valid value
 
-    def SendWait(self, command):
-        """Send a command and wait for a response."""
+    def SendWait(self, command, timeout=None):
+        """Send a command and wait (at most `timeout` s, if given) for a response."""
+        self.invalidate_para()  # The command may change parameters
         self.execute(command, 1000)  # Execute the command
-        while self.NotGotAnswer:
-            loop()  # Wait for the answer
+        return self.WaitAnswer(timeout)  # Wait for the answer
 
     def GetPara(self, TopicItem):
         """Get a parameter value from the DDE service."""
         self.execute(TopicItem, 1000)  # Execute the command
 
-        while self.NotGotAnswer:
-            loop()  # Wait for the answer
-
-        BackStr = self.LastAnswer  # Get the last answer
-        BackStr = str(BackStr, 'utf-8').split('\r\n')  # Convert to string and split
-        if len(BackStr) >= 2:
-            NrStr = BackStr[1].replace(',', '.')  # Replace comma with dot
-            val = float(NrStr)  # Convert to float
-            return val  # Return the value
-        return None  # Return None if no valid value
+        self.WaitAnswer()  # Wait for the answer
+
+        return _parse_float_answer(self.LastAnswer)  # Return the value, or None if no valid value
+
+    def GetCachedPara(self, key, TopicItem):
+        """Get a parameter value, reusing an answer younger than the cache TTL."""
+        now = time.monotonic()
+        cached = self._para_cache.get(key)
+        if cached is not None and now - cached[1] < self._para_ttl:
+            return cached[0]  # Fresh enough, skip the DDE round-trip
+        val = self.GetPara(TopicItem)  # Retrieve the parameter value
+        self._para_cache[key] = (val, now)
+        return val
+
+    def invalidate_para(self):
+        """Drop all cached parameter values."""
+        self._para_cache.clear()
 
     def GetScanPara(self, item):
         """Get scan parameter value."""
         TopicItem = f"a:=GetScanPara('{item}');\r\n  writeln(a);"
-        return self.GetPara(TopicItem)  # Retrieve the parameter value
+        return self.GetCachedPara(('scan', item), TopicItem)
 
     def GetFeedbackPara(self, item):
         """Get feedback parameter value."""
         TopicItem = f"a:=GetFeedPara('{item}');\r\n  writeln(a);"
-        return self.GetPara(TopicItem)  # Retrieve the parameter value
+        return self.GetCachedPara(('feed', item), TopicItem)
 
 
 class MyMsgClass(threading.Thread):
@@ -412,43 +642,146 @@ class MyMsgClass(threading.Thread):
 
     def run(self):
         """Run the main windows message loop."""
-        # Import necessary ctypes components for Windows API calls
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Start Msg loop")
+        
+        # Start the message loop using the cached function pointers and this thread's MSG
+        lpmsg = _thread_lpmsg()
+        while _GetMessageW(lpmsg, HWND(), 0, 0) > 0:
+            _TranslateMessage(lpmsg)  # Translate the message to a more understandable format
+            _DispatchMessageW(lpmsg)  # Dispatch the message to the appropriate window procedure
 
 
-        # Define types for the Windows message structure and function return types
-        LPMSG = POINTER(MSG)
-        LRESULT = c_ulong
-        
-        # Get the function pointers for Windows API functions
-        GetMessage = get_winfunc("user32", "GetMessageW", BOOL, (LPMSG, HWND, UINT, UINT))
-        TranslateMessage = get_winfunc("user32", "TranslateMessage", BOOL, (LPMSG,))
-        DispatchMessage = get_winfunc("user32", "DispatchMessageW", LRESULT, (LPMSG,))
-
-        # Create a MSG structure to hold the message
-        msg = MSG()
-        lpmsg = byref(msg)
-        
-        print("Debug: Start Msg loop")
-        
-        # Start the message loop
-        while GetMessage(lpmsg, HWND(), 0, 0) > 0:
-            TranslateMessage(lpmsg)  # Translate the message to a more understandable format
-            DispatchMessage(lpmsg)   # Dispatch the message to the appropriate window procedure
-            print("loop")  # Debug output to indicate the loop is running
+class DDEWorkerThread(threading.Thread):
+    """
+    Thread that owns a DDEClient and runs every DDE call on its behalf.
+
+    DDEML conversations are bound to the thread that called DdeInitialize, and
+    answers only arrive while that thread pumps messages. Creating the client
+    here and feeding it through a queue keeps blocking transactions (up to the
+    5 s request timeout) off the caller's thread; ctypes releases the GIL for
+    the duration of each user32 call, so the Qt thread keeps running.
+
+    Methods:
+        submit(name, *args): Queue DDEClient.<name>(*args), return a Future.
+            `name` may also be a callable, which is run as name(client, *args).
+        request_async(item): Non-blocking request(), returns a Future.
+        stop(): Disconnect and end the thread.
+    """
+
+    def __init__(self, service, topic):
+        threading.Thread.__init__(self, daemon=True)
+        self._service = service
+        self._topic = topic
+        self._queue = queue.Queue()
+        self._ready = Future()  # Resolves once the client is connected (or failed)
+        self.start()
+        self._ready.result()  # Re-raise connection errors in the caller
+
+    def run(self):
+        """Create the client, then serve queued calls while pumping messages."""
+        try:
+            client = DDEClient(self._service, self._topic)
+        except BaseException as e:
+            self._ready.set_exception(e)
+            return
+        self._ready.set_result(None)
+
+        try:
+            while True:
+                try:
+                    job = self._queue.get(timeout=ANSWER_WAIT_SLICE / 1000.0)
+                except queue.Empty:
+                    pump()  # Deliver advise data that arrived while idle
+                    continue
+                if job is None:
+                    break  # stop() requested
+                name, args, fut = job
+                if not fut.set_running_or_notify_cancel():
+                    continue
+                try:
+                    if isinstance(name, str):
+                        fut.set_result(getattr(client, name)(*args))
+                    else:
+                        fut.set_result(name(client, *args))
+                except BaseException as e:
+                    fut.set_exception(e)
+        finally:
+            # Disconnect here, on the owning thread: the client's bound-method
+            # callbacks keep it in a reference cycle, so __del__ would only run
+            # later in the GC, possibly on another thread.
+            client.close()
+
+    def submit(self, name, *args):
+        """Queue a DDEClient method call (or callable(client, *args)) and return its Future."""
+        fut = Future()
+        self._queue.put((name, args, fut))
+        return fut
+
+    def stop(self):
+        """Disconnect the client and end the worker thread (after queued calls; safe to repeat)."""
+        self._queue.put(None)
+
+    def request_async(self, item, timeout=5000):
+        """Request data from DDE service without blocking the caller."""
+        return self.submit('request', item, timeout)
+
+    def request(self, item, timeout=5000):
+        """Request data from DDE service."""
+        return self.submit('request', item, timeout).result()
+
+    def SendWait(self, command, timeout=None):
+        """
+        Send a command and wait for a response.
+
+        `timeout` (s) bounds the wait for the answer inside the worker, as in
+        DDEClient.SendWait, which then returns False; the caller waits for that
+        result rather than timing out on its own while the job is still queued.
+        """
+        return self.submit('SendWait', command, timeout).result()
+
+    def GetChannel(self, ch):
+        """Get the value of a specific channel."""
+        return self.submit('GetChannel', ch).result()
+
+    def GetScanPara(self, item):
+        """Get scan parameter value."""
+        return self.submit('GetScanPara', item).result()
+
+    def GetFeedbackPara(self, item):
+        """Get feedback parameter value."""
+        return self.submit('GetFeedbackPara', item).result()
+
+    def GetIniEntry(self, section, item):
+        """Retrieve a value from the INI configuration file."""
+        return self.submit('GetIniEntry', section, item).result()
 
 
 def loop():
-    LPMSG = POINTER(MSG)
-    LRESULT = c_ulong
-    GetMessage = get_winfunc("user32", "GetMessageW", BOOL, (LPMSG, HWND, UINT, UINT))
-    TranslateMessage = get_winfunc("user32", "TranslateMessage", BOOL, (LPMSG,))
-    DispatchMessage = get_winfunc("user32", "DispatchMessageW", LRESULT, (LPMSG,))
-
-    msg = MSG()
-    lpmsg = byref(msg)
-    GetMessage(lpmsg, HWND(), 0, 0)
-    TranslateMessage(lpmsg)
-    DispatchMessage(lpmsg)
-
-MySXM= DDEClient("SXM","Remote")
+    """Process a single Windows message using the cached function pointers."""
+    lpmsg = _thread_lpmsg()
+    _GetMessageW(lpmsg, HWND(), 0, 0)
+    _TranslateMessage(lpmsg)
+    _DispatchMessageW(lpmsg)
+
+def pump():
+    """Dispatch all pending Windows messages without blocking."""
+    lpmsg = _thread_lpmsg()
+    while _PeekMessageW(lpmsg, HWND(), 0, 0, PM_REMOVE):
+        _TranslateMessage(lpmsg)
+        _DispatchMessageW(lpmsg)
+
+# Shared client, created on first use by get_sxm() so importing this module stays cheap
+MySXM = None
+_MySXM_lock = threading.Lock()
+
+def get_sxm():
+    """Return the shared DDEClient("SXM", "Remote"), connecting on first call."""
+    global MySXM
+    if MySXM is None:
+        with _MySXM_lock:
+            if MySXM is None:
+                MySXM = DDEClient("SXM", "Remote")
+    return MySXM
+
 
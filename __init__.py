@@ -0,0 +1,4 @@
+import logging
+
+# Library default: stay silent unless the application configures logging.
+logging.getLogger(__name__).addHandler(logging.NullHandler())
@@ -5,22 +5,72 @@ Entry point for the NC-AFM control GUI.
 This module is intentionally thin. It:
 1) Creates the Qt application
 2) Builds a single, centralized SXMConnection (DDE + IOCTL)
-3) Passes that connection to the main window
-4) Shows a concise connection status dialog
+3) Passes that connection to the main window and shows it
+4) Shows a concise, non-modal connection status dialog on top
 5) Starts the Qt event loop
 """
 
+import argparse
+import logging
 import os
 import sys
-from PyQt5 import QtWidgets
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
 
-from sxm_ncafm_control.connection import SXMConnection
-from sxm_ncafm_control.gui.main_window import MainWindow
+# PyQt5, the connection layer and the GUI are imported inside main(), so that
+# argument errors and --help do not pay for loading the Qt stack and pywin32.
+if TYPE_CHECKING:
+    from PyQt5 import QtWidgets
+    from sxm_ncafm_control.connection import SXMConnection
 
 
-def show_connection_status_dialog(parent: QtWidgets.QWidget, conn: SXMConnection) -> None:
+# Package directory, resolved once at import
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+# QSettings location and key for the "don't show again" choice of the offline dialog
+_SETTINGS_ORG, _SETTINGS_APP = "sxm_ncafm_control", "app"
+_SUPPRESS_OFFLINE_KEY = "suppress_offline_dialog"
+
+# Known DDE failure signatures (casefolded needle, user-facing explanation), checked in order.
+_DDE_ERROR_TABLE = (
+    ("0x400a", "SXM did not accept the DDE conversation. Is the SXM software running?"),
+    ("unable to establish a conversation", "SXM did not accept the DDE conversation. Is the SXM software running?"),
+    ("unable to register with ddeml", "Windows DDE could not be initialized for this process."),
+    ("sxmremote.py not found", "SXMRemote.py is missing from the application folder."),
+    ("no module named 'win32", "pywin32 is not installed (DDE requires Windows + pywin32)."),
+)
+
+
+@lru_cache(maxsize=32)
+def interpret_dde_error(error_msg: str) -> str:
+    """
+    Translate a low-level DDE error message into a short explanation.
+
+    Pure function of its argument, so results are memoized: repeated identical
+    errors (e.g. from a reconnect loop) cost a single dict lookup.
+
+    Parameters
+    ----------
+    error_msg : str
+        Text of the exception raised while connecting.
+
+    Returns
+    -------
+    str
+        A user-friendly explanation, or the original message if unknown.
     """
-    Show a single startup dialog that summarizes the current connection state.
+    contains = str(error_msg).casefold().__contains__
+    for needle, msg in _DDE_ERROR_TABLE:
+        if contains(needle):
+            return msg
+    return error_msg
+
+
+def show_connection_status_dialog(
+    parent: "Optional[QtWidgets.QWidget]", conn: "SXMConnection"
+) -> "QtWidgets.QMessageBox":
+    """
+    Show a single non-modal startup dialog that summarizes the connection state.
 
     The dialog reports DDE connectivity (real vs. mock) and IOCTL availability.
     Detailed low-level errors are printed by the connection layer to the console;
@@ -28,22 +78,31 @@ def show_connection_status_dialog(parent: QtWidgets.QWidget, conn: SXMConnection
 
     Parameters
     ----------
-    parent : QtWidgets.QWidget
-        Parent widget used for dialog positioning.
+    parent : QtWidgets.QWidget or None
+        Parent widget used for dialog positioning; it also keeps the dialog alive.
     conn : SXMConnection
         The centralized connection object holding DDE and IOCTL handles.
+
+    Returns
+    -------
+    QtWidgets.QMessageBox
+        The dialog, already shown. It does not block: use its ``finished``
+        signal to react when the user closes it.
     """
     # Determine states without importing backend classes here.
-    dde_online = getattr(conn, "dde", None) is not None and not getattr(conn, "is_offline", False)
-    driver_online = getattr(conn, "driver", None) is not None
-
     # If either DDE fell back to mock or the driver is missing, call it "offline mode"
     # for user purposes. (You can refine this if you want a tri-state later.)
-    is_fully_online = dde_online and driver_online
+    is_fully_online = conn.online_mode
+    dde_online = conn.dde is not None and not conn.is_offline
+    driver_online = conn.driver is not None
 
     # Build concise lines for the dialog.
     dde_line = "✅ DDE: connected (real SXM)" if dde_online else "⚠️ DDE: offline (using mock)"
     drv_line = "✅ Driver: available (IOCTL OK)" if driver_online else "⚠️ Driver: not available"
+    if not dde_online and conn.dde_error is not None:
+        dde_line += f"\n   → {interpret_dde_error(str(conn.dde_error))}"
+
+    from PyQt5 import QtCore, QtWidgets
 
     dialog = QtWidgets.QMessageBox(parent)
     dialog.setWindowTitle("SXM Connection Status")
@@ -66,8 +125,14 @@ def show_connection_status_dialog(parent: QtWidgets.QWidget, conn: SXMConnection
             "• Ensure the SXM driver/device is present\n"
             "• Restart this application"
         )
+        dialog.setCheckBox(QtWidgets.QCheckBox("Don't show this again when offline"))
 
-    dialog.exec_()
+    # Non-modal: the main window stays responsive and the event loop is not
+    # entered a second time just to wait for the OK button.
+    dialog.setModal(False)
+    dialog.setAttribute(QtCore.Qt.WA_DeleteOnClose)
+    dialog.show()
+    return dialog
 
 
 def main() -> int:
@@ -77,37 +142,101 @@ def main() -> int:
     Returns
     -------
     int
-        Qt exit code (0 on normal termination).
+        Qt exit code (0 on normal termination). With ``--headless``, 0 if the
+        main window was built and shown, 1 otherwise.
     """
+    # Split off our own flags; everything else is passed through to Qt.
+    parser = argparse.ArgumentParser(description="NC-AFM control GUI")
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Build the window offscreen, skip the status dialog and exit (smoke tests).",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Log debug messages (e.g. mock DDE traffic) to the console. Also enabled by $SXM_DEBUG.",
+    )
+    parser.add_argument(
+        "--overlapped-io",
+        action="store_true",
+        help="Open the IOCTL driver for overlapped I/O (pipelined reads). Also enabled by $SXM_OVERLAPPED_IO.",
+    )
+    args, qt_args = parser.parse_known_args(sys.argv[1:])
+
+    # Console logging: warnings (offline notices) by default, everything when verbose.
+    verbose = args.verbose or bool(os.environ.get("SXM_DEBUG"))
+    logging.basicConfig(
+        level=logging.DEBUG if verbose else logging.WARNING,
+        format="%(message)s",
+    )
+
+    from PyQt5 import QtCore, QtWidgets
+
     # Create the Qt application instance first.
-    app = QtWidgets.QApplication(sys.argv)
+    if args.headless:
+        app = QtWidgets.QApplication([sys.argv[0], "-platform", "offscreen"] + qt_args)
+    else:
+        app = QtWidgets.QApplication([sys.argv[0]] + qt_args)
 
     # Ensure the package directory is in sys.path so local modules (e.g., SXMRemote.py)
     # can be found when the connection layer tries to import them.
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    if current_dir not in sys.path:
-        sys.path.insert(0, current_dir)
+    if _HERE not in sys.path:
+        sys.path.insert(0, _HERE)
 
     # Build a single, centralized connection manager.
     # SXMConnection is responsible for:
     #   - Establishing DDE (real or mock fallback)
     #   - Opening IOCTL driver (or None if unavailable)
     #   - Printing unified "OFFLINE MODE" messages to the console when needed
-    conn = SXMConnection()
+    from sxm_ncafm_control.connection import SXMConnection
+
+    conn = SXMConnection(
+        driver_overlapped=args.overlapped_io or bool(os.environ.get("SXM_OVERLAPPED_IO"))
+    )
 
     # Create and show the main window. Pass the connection object in, so all
     # tabs/widgets share the same handles and no one re-implements connection logic.
+    from sxm_ncafm_control.gui.main_window import MainWindow
+
     win = MainWindow(conn)
-    win.show()
 
     # Append mode tag to the window title for constant visual feedback.
     # Consider "PARTIAL" if you later differentiate cases (e.g., DDE real, driver None).
-    mode_suffix = " - ONLINE" if (getattr(conn, "driver", None) is not None and not getattr(conn, "is_offline", False)) else " - OFFLINE"
+    mode_suffix = " - ONLINE" if conn.online_mode else " - OFFLINE"
     if not win.windowTitle().endswith(mode_suffix):
         win.setWindowTitle(win.windowTitle() + mode_suffix)
 
-    # Show a concise connection dialog once at startup.
-    show_connection_status_dialog(win, conn)
+    win.show()
+
+    # Show the connection summary on top of the already painted window.
+    # Headless runs skip it (nobody is there to close it), and so do offline
+    # launches after the user ticked "don't show again".
+    settings = QtCore.QSettings(_SETTINGS_ORG, _SETTINGS_APP)
+    suppressed = not conn.online_mode and settings.value(_SUPPRESS_OFFLINE_KEY, False, type=bool)
+    if not args.headless and not suppressed:
+        dialog = show_connection_status_dialog(win, conn)
+        if dialog.checkBox() is not None:
+
+            def _remember_choice(_result: int) -> None:
+                if dialog.checkBox().isChecked():
+                    settings.setValue(_SUPPRESS_OFFLINE_KEY, True)
+
+            dialog.finished.connect(_remember_choice)
+
+    # Headless runs build every tab right away, then stop: no event loop.
+    if args.headless:
+        win.initialize()
+        ok = win.isVisible()
+        conn.close()
+        return 0 if ok else 1
+
+    # Tear down the DDE conversation and driver handle before the interpreter
+    # exits (the DDE worker is a daemon thread and would just be killed).
+    app.aboutToQuit.connect(conn.close)
+
+    # Build the remaining tabs once the window has been painted.
+    QtCore.QTimer.singleShot(0, win.initialize)
 
     # Enter the Qt event loop.
     return app.exec_()
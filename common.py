@@ -1,8 +1,11 @@
 # gui/common.py
 
+import logging
 from typing import Optional
 from PyQt5 import QtWidgets, QtGui
 
+logger = logging.getLogger(__name__)
+
 # ---------------- Parameter registry ----------------
 PARAMS_BASE = [
     ("amp_ref", "EDIT", "Edit23", "Amplitude Ref", True), #guarded
@@ -14,6 +17,14 @@ PARAMS_BASE = [
     ("drive", "DNC", 4, "Drive", True),                    # guarded
 ]
 
+# Registry lookups, built once at import: key -> entry, (ptype, pcode) -> entry,
+# key -> row (base parameters occupy the first rows of the parameter table),
+# and the keys in table order.
+PARAMS_BY_KEY = {p[0]: p for p in PARAMS_BASE}
+PARAMS_BY_CODE = {(p[1], p[2]): p for p in PARAMS_BASE}
+PARAMS_BASE_ROW = {p[0]: i for i, p in enumerate(PARAMS_BASE)}
+PARAMS_KEYS = tuple(p[0] for p in PARAMS_BASE)
+
 PARAM_TOOLTIPS = {
     "amp_ref": "Target oscillation amplitude (units follow SXM).",
     "amp_ki": "Amplitude loop integral gain...",
@@ -26,6 +37,7 @@ PARAM_TOOLTIPS = {
 
 # Voltage safety limit
 VOLTAGE_LIMIT_ABS = 10.0
+_V_LO, _V_HI = -VOLTAGE_LIMIT_ABS, VOLTAGE_LIMIT_ABS  # Safe range, precomputed for the fast path
 
 
 def _to_float(text: str) -> Optional[float]:
@@ -48,9 +60,12 @@ def _to_float(text: str) -> Optional[float]:
     float or None
         The numeric value if conversion succeeds, or None if it fails.
     """
+    s = text.strip()
+    if not s:
+        return None  # Empty cell: the common invalid case, no exception needed
     try:
-        return float(text)
-    except Exception:
+        return float(s)
+    except ValueError:
         return None
 
 
@@ -77,7 +92,7 @@ def confirm_high_voltage(parent: QtWidgets.QWidget, label: str, value: float) ->
     bool
         True if the user confirms, False if they cancel.
     """
-    if abs(value) <= VOLTAGE_LIMIT_ABS:
+    if _V_LO <= value <= _V_HI:
         return True
     box = QtWidgets.QMessageBox(parent)
     box.setIcon(QtWidgets.QMessageBox.Warning)
@@ -115,6 +130,11 @@ class NumericItemDelegate(QtWidgets.QStyledItemDelegate):
     def __init__(self, parent=None, lo=-1e12, hi=1e12, decimals=9):
         super().__init__(parent)
         self._lo, self._hi, self._dec = lo, hi, decimals
+        # One validator shared by every editor this delegate creates. It is owned
+        # by the delegate (QLineEdit.setValidator does not take ownership), so it
+        # outlives the short-lived editors.
+        self._validator = QtGui.QDoubleValidator(lo, hi, decimals, self)
+        self._validator.setNotation(QtGui.QDoubleValidator.StandardNotation)
 
     def createEditor(self, parent, option, index):
         """
@@ -137,14 +157,12 @@ class NumericItemDelegate(QtWidgets.QStyledItemDelegate):
             An editor widget with numeric validation.
         """
         editor = QtWidgets.QLineEdit(parent)
-        validator = QtGui.QDoubleValidator(self._lo, self._hi, self._dec, editor)
-        validator.setNotation(QtGui.QDoubleValidator.StandardNotation)
-        editor.setValidator(validator)
+        editor.setValidator(self._validator)
         return editor
     
 def offline_message(component: str, error: Exception, mock_name: str):
     """
-    Print a clear, consistent offline-mode message.
+    Log a clear, consistent offline-mode message (WARNING level).
 
     Parameters
     ----------
@@ -155,9 +173,9 @@ def offline_message(component: str, error: Exception, mock_name: str):
     mock_name : str
         What we will fall back to ("mock driver", "MockDDEClient", etc.)
     """
-    err_msg = str(error)
-    print(
-        f"\n[OFFLINE MODE] {component} is not available.\n"
-        f"→ Cause: {err_msg}\n"
-        f"→ Action: Switching to {mock_name} (no hardware connected).\n"
+    logger.warning(
+        "\n[OFFLINE MODE] %s is not available.\n"
+        "→ Cause: %s\n"
+        "→ Action: Switching to %s (no hardware connected).\n",
+        component, error, mock_name,
     )
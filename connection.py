@@ -2,25 +2,61 @@
 from .dde_client import RealDDEClient, MockDDEClient
 from .device_driver import SXMIOCTL
 from . import common
+
+_UNSET = object()  # Marks a handle that has not been opened yet
+
+
 class SXMConnection:
     """
     Holds both DDE and IOCTL handles.
     If offline, provides mock fallbacks.
+
+    Each handle is opened on first access, so code that only needs one
+    subsystem does not pay for connecting the other.
+
+    driver_overlapped opens the IOCTL driver for overlapped I/O (see SXMIOCTL);
+    off by default.
     """
-    def __init__(self):
-        # DDE
-        try:
-            self.dde = RealDDEClient()
-        except Exception as e:
-            common.offline_message("DDE connection", e, "MockDDEClient")
-            self.dde = MockDDEClient()
-
-        # IOCTL
-        try:
-            self.driver = SXMIOCTL()
-        except Exception as e:
-            common.offline_message("Microscope driver", e, "mock driver")
-            self.driver = None
+    __slots__ = ("_dde", "_driver", "_driver_overlapped", "dde_error")
+
+    def __init__(self, driver_overlapped=False):
+        self._dde = _UNSET
+        self._driver = _UNSET
+        self._driver_overlapped = driver_overlapped
+        self.dde_error = None  # Why the real DDE client could not be used, if it failed (set when dde is first accessed)
+
+    @property
+    def dde(self):
+        if self._dde is _UNSET:
+            try:
+                self._dde = RealDDEClient()
+            except Exception as e:
+                common.offline_message("DDE connection", e, "MockDDEClient")
+                self.dde_error = e
+                self._dde = MockDDEClient()
+        return self._dde
+
+    @property
+    def driver(self):
+        if self._driver is _UNSET:
+            try:
+                self._driver = SXMIOCTL(overlapped=self._driver_overlapped)
+            except Exception as e:
+                common.offline_message("Microscope driver", e, "mock driver")
+                self._driver = None
+        return self._driver
+
+    def close(self):
+        """Close whichever handles were opened (DDE worker, IOCTL driver)."""
+        if self._dde is not _UNSET:
+            self._dde.close()
+        if self._driver is not _UNSET and self._driver is not None:
+            self._driver.close()
+
+    @property
+    def online_mode(self):
+        # Single source of truth for "everything is talking to real hardware"
+        return self.driver is not None and not self.is_offline
 
     @property
     def is_offline(self):
@@ -13,111 +13,470 @@ values, even in cases where the underlying SXM system is write-only (you can sen
 parameters but not read them back).
 
 Public API:
-    - send_scanpara(edit_code: str, value: float) -> None
-    - send_dncpara(index: int, value: float) -> None
+    - send_scanpara(edit_code: str, value: float, skip_unchanged=False) -> None
+    - send_dncpara(index: int, value: float, skip_unchanged=False) -> None
+      (skip_unchanged=True skips a write equal to the last written value; SXM
+      is write-only, so changes made on the SXM side are not seen by this check)
+    - send_scanpara_nowait / send_dncpara_nowait -> coalesced fire-and-forget writes
     - read_channel(index: int) -> float
+    - read_channels(indices) -> np.ndarray
     - set_channel(index: int, value: float) -> None
     - read_topography() -> float
+    - request_async(item: str) -> Future   (real client only)
+    - batch() -> context manager grouping writes into one DDE round-trip
+    - send_batch(writes) -> apply [(method_name, *args), ...] as one batch
     - last_written(ptype: str, pcode: str) -> float | None
 """
 
-from typing import Dict, Tuple
+import importlib.util
+import logging
+import re
+import sys
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
+
+
+def _lazy_module(name: str):
+    """
+    Register `name` in sys.modules with a lazy loader and return it.
+
+    The module body (for SXMRemote: ctypes/pywin32 setup and user32 bindings)
+    only runs on first attribute access. Returns None if the module cannot be
+    found on sys.path.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        spec = None
+    if spec is None or spec.loader is None:
+        return None
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+SXMRemote = _lazy_module("SXMRemote")
+
+
+def _get_sxmremote():
+    """Return the (lazy) SXMRemote module, retrying the lookup until it is found."""
+    global SXMRemote
+    if SXMRemote is None:
+        # sys.path may have been extended after this module was imported
+        SXMRemote = _lazy_module("SXMRemote")
+    return SXMRemote
+
+
+# Validator for SXM edit codes ("Edit23", ...), compiled once
+_EDIT_RE = re.compile(r"Edit\d+").fullmatch
+
+
+@lru_cache(maxsize=128)
+def _is_edit_code(code: str) -> bool:
+    """Memoized _EDIT_RE check; repeated writes to one code skip the regex."""
+    return _EDIT_RE(code) is not None
+
+
+@lru_cache(maxsize=64)
+def _scanpara_template(edit_code: str) -> str:
+    """"ScanPara('EditNN', %s);" with the code already filled in."""
+    return f"ScanPara('{edit_code}', %s);"
+
+
+@lru_cache(maxsize=64)
+def _dncpara_template(index: int) -> str:
+    """"DNCPara(N, %s);" with the index already filled in."""
+    return f"DNCPara({index}, %s);"
+
+
+# Canonical (upper-case) ptype for the spellings callers use; others fall back to upper()
+_PTYPE_CANON = {
+    "EDIT": "EDIT", "Edit": "EDIT", "edit": "EDIT",
+    "DNC": "DNC", "dnc": "DNC",
+    "FEED": "FEED", "Feed": "FEED", "feed": "FEED",
+    "SETCHAN": "SETCHAN", "Setchan": "SETCHAN",
+    "CHAN": "CHAN", "Chan": "CHAN", "chan": "CHAN",
+}
+
+@lru_cache(maxsize=256)
+def _index_str(index: int) -> str:
+    """Cached, interned str(index) for DNC/channel cache keys."""
+    return sys.intern(str(index))
+
+
+# Writes closer than this to the last written value count as unchanged (skip_unchanged=True)
+_WRITE_TOL = 1e-12
 
 
 class BaseDDE:
     """Base class for DDE clients with last-written value caching."""
 
-    def __init__(self) -> None:
-        self._last: Dict[Tuple[str, str], float] = {}
+    __slots__ = ("_last", "_max_per_type")
+
+    def __init__(self, max_per_type: int = 4096) -> None:
+        # PTYPE -> pcode -> value; two str-keyed lookups, no tuple key per access.
+        # Each inner dict is kept in least-recently-written order and capped at
+        # max_per_type entries, so long unattended sessions stay bounded.
+        self._last: Dict[str, Dict[str, float]] = {}
+        self._max_per_type = max_per_type
+
+    def _store(self, ptype: str, pcode: str, value: float) -> None:
+        inner = self._last.get(ptype)
+        if inner is None:
+            inner = self._last[ptype] = {}
+        elif inner.pop(pcode, None) is None and len(inner) >= self._max_per_type:
+            del inner[next(iter(inner))]  # Evict the least recently written
+        inner[pcode] = value if type(value) is float else float(value)
+
+    def _unchanged(self, ptype: str, pcode: str, value: float) -> bool:
+        """True if `value` matches the last write to (ptype, pcode) within _WRITE_TOL."""
+        inner = self._last.get(ptype)
+        if inner is None:
+            return False
+        old = inner.get(pcode)
+        if old is None:
+            return False
+        try:
+            return abs(old - float(value)) < _WRITE_TOL
+        except (TypeError, ValueError):
+            return False  # Not numeric: never treat as a repeat
+
+    def _remember_str(self, ptype: str, pcode: str, value: float) -> None:
+        """Store a write; ptype must already be upper case and pcode a str."""
+        self._store(ptype, sys.intern(pcode), value)
 
-    def _remember(self, ptype: str, pcode: str, value: float) -> None:
-        self._last[(ptype.upper(), str(pcode))] = float(value)
+    def _remember_int(self, ptype: str, index: int, value: float) -> None:
+        """Store a write for an integer pcode (DNC index, channel)."""
+        self._store(ptype, _index_str(index), value)
 
     def last_written(self, ptype: str, pcode: str):
-        return self._last.get((ptype.upper(), str(pcode)))
+        inner = self._last.get(_PTYPE_CANON.get(ptype) or ptype.upper())
+        if inner is None:
+            return None
+        # Interned keys let the dict probe succeed on identity
+        return inner.get(sys.intern(pcode if type(pcode) is str else str(pcode)))
+
+    def close(self) -> None:
+        """Release the connection; clients without one have nothing to do."""
+
+    @contextmanager
+    def batch(self):
+        """Group several writes; clients without batching send them immediately."""
+        yield self
+
+    def send_scanpara_nowait(self, edit_code: str, value: float) -> None:
+        """Fire-and-forget ScanPara write; clients without a background sender write synchronously."""
+        self.send_scanpara(edit_code, value)
+
+    def send_dncpara_nowait(self, index: int, value: float) -> None:
+        """Fire-and-forget DNCPara write; clients without a background sender write synchronously."""
+        self.send_dncpara(index, value)
+
+    def read_channels(self, indices: Sequence[int]) -> np.ndarray:
+        """Read several channels into one preallocated float64 array."""
+        out = np.empty(len(indices), dtype=np.float64)
+        read = self.read_channel
+        for i, index in enumerate(indices):
+            out[i] = read(index)
+        return out
+
+    def send_batch(self, writes) -> None:
+        """
+        Apply several writes as one batch.
+
+        `writes` is an iterable of (method_name, *args) tuples, e.g.
+        [("send_scanpara", "Edit23", 0.08), ("send_dncpara", 3, 1.0)].
+        """
+        with self.batch():
+            for name, *args in writes:
+                getattr(self, name)(*args)
 
 
 class RealDDEClient(BaseDDE):
     """Real DDE client that communicates with SXM via SXMRemote.DDEClient (Windows only)."""
 
+    __slots__ = (
+        "_dde", "_command_count", "_buffer", "_buffered_writes",
+        "_nowait", "_nowait_lock", "_nowait_seq", "_nowait_keyseq",
+    )
+
     def __init__(self, app_name: str = "SXM", topic: str = "Remote") -> None:
         super().__init__()
-        try:
-            import SXMRemote  # type: ignore
-        except ImportError as e:
+        sxm_remote = _get_sxmremote()
+        if sxm_remote is None:
             raise ImportError(
                 "SXMRemote.py not found. Put it next to this module or in PYTHONPATH."
-            ) from e
+            )
 
-        self._dde = SXMRemote.DDEClient(app_name, topic)
+        # The worker thread owns the DDE conversation so blocking transactions
+        # never run on the Qt thread's message queue.
+        self._dde = sxm_remote.DDEWorkerThread(app_name, topic)
         self._command_count = 0
+        self._buffer = None  # List of pending commands while inside batch()
+        self._buffered_writes = None  # Matching (remember, ptype, pcode, value) records
+        # Fire-and-forget writes: latest command per (PTYPE, pcode) for the flush
+        # job currently queued on the worker, or None if there is none open
+        self._nowait: Optional[Dict[tuple, str]] = None
+        self._nowait_lock = threading.Lock()
+        # Count of nowait writes, and the count at each key's latest one: a
+        # synchronous write that finishes after a newer nowait write to the same
+        # key must not overwrite that key's last_written() value
+        self._nowait_seq = 0
+        self._nowait_keyseq: Dict[tuple, int] = {}
+
+    def _send(self, command: str, remember, ptype: str, pcode, value) -> None:
+        """
+        Send one Pascal statement now, or queue it while a batch is open.
+
+        The write is recorded with `remember(ptype, pcode, value)` only once
+        SXM has accepted it.
+        """
+        if self._buffer is not None:
+            self._buffer.append(command)
+            self._buffered_writes.append((remember, ptype, pcode, value))
+        else:
+            seq = self._send_wait(command)
+            self._remember_unless_overtaken(seq, remember, ptype, pcode, value)
+
+    def _remember_unless_overtaken(self, seq: int, remember, ptype: str, pcode, value) -> None:
+        """Record a synchronous write sent at nowait count `seq`, unless a newer nowait write replaced it."""
+        if self._nowait_keyseq.get((ptype, pcode), 0) <= seq:
+            remember(ptype, pcode, value)
+
+    def _send_wait(self, command: str) -> int:
+        """
+        Send `command` on the worker and wait, keeping order with nowait writes.
+
+        The open fire-and-forget batch is sealed first: its queued flush goes
+        out before this command, and later nowait writes start a new flush that
+        is queued after it, so they cannot overtake it.
+
+        Returns the nowait write count at submission, for
+        _remember_unless_overtaken().
+        """
+        with self._nowait_lock:
+            self._nowait = None
+            seq = self._nowait_seq
+            fut = self._dde.submit("SendWait", command)
+        fut.result()
+        return seq
+
+    def close(self, timeout: float = 2.0) -> None:
+        """
+        Stop the DDE worker, which disconnects and uninitializes DDE on its own
+        thread, and wait up to `timeout` s for it to finish. Safe to call twice.
 
-    def send_scanpara(self, edit_code: str, value: float) -> None:
-        if not (isinstance(edit_code, str) and edit_code.startswith("Edit")):
+        The worker is a daemon thread: without this, interpreter exit kills it
+        before the conversation is torn down.
+        """
+        self._dde.stop()
+        self._dde.join(timeout)
+
+    def begin_batch(self) -> None:
+        """Start collecting writes instead of sending them one by one."""
+        if self._buffer is None:
+            self._buffer = []
+            self._buffered_writes = []
+
+    def end_batch(self) -> None:
+        """Send all collected writes as one DDE program and stop batching."""
+        buffer, self._buffer = self._buffer, None
+        writes, self._buffered_writes = self._buffered_writes, None
+        if buffer:
+            seq = self._send_wait("\r\n  ".join(buffer))
+            for remember, ptype, pcode, value in writes:
+                self._remember_unless_overtaken(seq, remember, ptype, pcode, value)
+
+    @contextmanager
+    def batch(self):
+        """
+        Send every write made inside the block in a single SendWait round-trip.
+
+        last_written() is updated once the combined program has been sent; if
+        sending fails, none of the batched writes are recorded. Nested batches
+        join the outer one.
+        """
+        if self._buffer is not None:
+            yield self
+            return
+        self.begin_batch()
+        try:
+            yield self
+        finally:
+            self.end_batch()
+
+    def send_scanpara(self, edit_code: str, value: float, skip_unchanged: bool = False) -> None:
+        """Write a ScanPara; with `skip_unchanged`, a repeat of the last written value is not sent."""
+        if not _is_edit_code(edit_code):
             raise ValueError("edit_code must look like 'EditNN' (e.g., 'Edit23').")
-        self._dde.SendWait(f"ScanPara('{edit_code}', {value});")
-        self._remember("EDIT", edit_code, value)
+        if skip_unchanged and self._unchanged("EDIT", edit_code, value):
+            return
+        self._send(_scanpara_template(edit_code) % (value,), self._remember_str, "EDIT", edit_code, value)
         self._command_count += 1
 
-    def send_dncpara(self, index: int, value: float) -> None:
+    def send_dncpara(self, index: int, value: float, skip_unchanged: bool = False) -> None:
+        """Write a DNCPara; with `skip_unchanged`, a repeat of the last written value is not sent."""
         if index < 0:
             raise ValueError("DNC index must be non-negative.")
-        self._dde.SendWait(f"DNCPara({index}, {value});")
-        self._remember("DNC", str(index), value)
+        if skip_unchanged and self._unchanged("DNC", _index_str(index), value):
+            return
+        self._send(_dncpara_template(index) % (value,), self._remember_int, "DNC", index, value)
+
+    def _send_nowait(self, key: tuple, command: str) -> None:
+        """Queue `command` as the latest pending write for `key`; schedule one flush."""
+        with self._nowait_lock:
+            pending = self._nowait
+            if pending is None:
+                # Submitted under the lock, so queue order matches _send_wait()
+                pending = self._nowait = {}
+                self._dde.submit(self._flush_nowait, pending)
+            pending[key] = command
+            self._nowait_seq += 1
+            self._nowait_keyseq[key] = self._nowait_seq
+
+    def _flush_nowait(self, client, pending: Dict[tuple, str]) -> None:
+        """Runs on the DDE worker: send every write of one fire-and-forget batch at once."""
+        with self._nowait_lock:
+            if self._nowait is pending:
+                self._nowait = None  # Later writes start a new batch
+            commands = list(pending.values())
+        if commands:
+            try:
+                client.SendWait("\r\n  ".join(commands))
+            except Exception:
+                logger.warning("Fire-and-forget DDE write failed", exc_info=True)
+
+    def send_scanpara_nowait(self, edit_code: str, value: float) -> None:
+        """
+        Queue a ScanPara write without waiting for SXM.
+
+        Writes to the same code that are still pending are coalesced, so a fast
+        slider costs one DDE round-trip per flush. last_written() is updated
+        immediately.
+        """
+        if not _is_edit_code(edit_code):
+            raise ValueError("edit_code must look like 'EditNN' (e.g., 'Edit23').")
+        self._send_nowait(("EDIT", edit_code), _scanpara_template(edit_code) % (value,))
+        self._remember_str("EDIT", edit_code, value)
+        self._command_count += 1
+
+    def send_dncpara_nowait(self, index: int, value: float) -> None:
+        """Queue a DNCPara write without waiting for SXM (coalesced like send_scanpara_nowait)."""
+        if index < 0:
+            raise ValueError("DNC index must be non-negative.")
+        self._send_nowait(("DNC", index), _dncpara_template(index) % (value,))
+        self._remember_int("DNC", index, value)
 
     def read_channel(self, index: int) -> float:
-        return float(self._dde.GetChannel(int(index)))
+        return float(self._dde.GetChannel(index if type(index) is int else int(index)))
+
+    def read_channels(self, indices: Sequence[int]) -> np.ndarray:
+        """
+        Read several channels into one float64 array.
+
+        All GetChannel calls are queued on the DDE worker before waiting on the
+        first, so the caller pays one thread hand-off for the whole set.
+        """
+        submit = self._dde.submit
+        futures = [submit("GetChannel", index if type(index) is int else int(index)) for index in indices]
+        out = np.empty(len(futures), dtype=np.float64)
+        for i, fut in enumerate(futures):
+            out[i] = fut.result()
+        return out
+
+    def request_async(self, item: str):
+        """Request a DDE item without blocking; returns a concurrent.futures.Future."""
+        return self._dde.request_async(item)
 
     def set_channel(self, index: int, value: float) -> None:
-        self._dde.SendWait(f"SetChannel({index}, {value});")
-        self._remember("Setchan", str(index), value)
+        idx = index if type(index) is int else int(index)
+        self._send(f"SetChannel({idx}, {value});", self._remember_int, "SETCHAN", idx, value)
 
     def read_topography(self) -> float:
         return self.read_channel(0)
 
     def feed_para(self, ptype: str, value: int) -> None:
-        self._dde.SendWait(f"FeedPara('{ptype}', {int(value)});")
-        self._remember("FEED", ptype, int(value))
+        self._send(f"FeedPara('{ptype}', {int(value)});", self._remember_str, "FEED", ptype, int(value))
+
+
+# Debug trace templates for the mock client
+_MOCK_SCAN = "[MOCK] #%03d ScanPara('%s', %s);"
+_MOCK_DNC = "[MOCK] #%03d DNCPara(%s, %s);"
+_MOCK_SETCHAN = "[MOCK] #%03d SetChannel(%d, %s);"
+_MOCK_FEED = "[MOCK] #%03d FeedPara('%s', %s);"
+
+# Simulated topography drift for the mock: 0.001 .. 1.000, repeating (exact, no accumulated rounding)
+_SIM_DRIFT = tuple(i / 1000.0 for i in range(1, 1001))
 
 
 class MockDDEClient(BaseDDE):
     """Offline mock client for development and testing without SXM software."""
 
+    __slots__ = ("_command_count", "_sim_step", "_channel_readers")
+
     def __init__(self) -> None:
         super().__init__()
         self._command_count = 0
+        self._sim_step = 0  # Number of topography reads so far
+        # Channel index -> simulated reader; unlisted channels read as zero
+        self._channel_readers = {0: self._read_topo}
 
-    def send_scanpara(self, edit_code: str, value: float) -> None:
-        if not (isinstance(edit_code, str) and edit_code.startswith("Edit")):
+    def send_scanpara(self, edit_code: str, value: float, skip_unchanged: bool = False) -> None:
+        if not _is_edit_code(edit_code):
             raise ValueError("edit_code must look like 'EditNN' (e.g., 'Edit23').")
+        if skip_unchanged and self._unchanged("EDIT", edit_code, value):
+            return
         self._command_count += 1
-        print(f"[MOCK] #{self._command_count:03d} ScanPara('{edit_code}', {value});")
-        self._remember("EDIT", edit_code, value)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(_MOCK_SCAN, self._command_count, edit_code, value)
+        self._remember_str("EDIT", edit_code, value)
 
-    def send_dncpara(self, index: int, value: float) -> None:
+    def send_dncpara(self, index: int, value: float, skip_unchanged: bool = False) -> None:
         if index < 0:
             raise ValueError("DNC index must be non-negative.")
+        if skip_unchanged and self._unchanged("DNC", _index_str(index), value):
+            return
         self._command_count += 1
-        print(f"[MOCK] #{self._command_count:03d} DNCPara({index}, {value});")
-        self._remember("DNC", str(index), value)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(_MOCK_DNC, self._command_count, index, value)
+        self._remember_int("DNC", index, value)
 
-    def read_channel(self, index: int) -> float:
-        base = getattr(self, "_sim_base", 0.0)
-        base += 0.001
-        self._sim_base = base
-        if int(index) == 0:
-            return base
+    def _read_topo(self) -> float:
+        step = self._sim_step
+        self._sim_step = step + 1
+        return _SIM_DRIFT[step % 1000]
+
+    @staticmethod
+    def _read_zero() -> float:
         return 0.0
 
+    def read_channel(self, index: int) -> float:
+        return self._channel_readers.get(index if type(index) is int else int(index), self._read_zero)()
+
     def set_channel(self, index: int, value: float) -> None:
+        idx = index if type(index) is int else int(index)
         self._command_count += 1
-        print(f"[MOCK] #{self._command_count:03d} SetChannel({int(index)}, {float(value)});")
-        self._remember("CHAN", str(index), float(value))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(_MOCK_SETCHAN, self._command_count, idx, float(value))
+        self._remember_int("CHAN", idx, value)
 
     def read_topography(self) -> float:
         return self.read_channel(0)
 
     def feed_para(self, ptype: str, value: float) -> None:
         self._command_count += 1
-        print(f"[MOCK] #{self._command_count:03d} FeedPara('{ptype}', {float(value)});")
-        self._remember("FEED", ptype, float(value))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(_MOCK_FEED, self._command_count, ptype, float(value))
+        self._remember_str("FEED", ptype, value)
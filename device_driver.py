@@ -16,8 +16,8 @@ to communicate directly with device drivers. The SXM driver exposes channel
 data through a specific IOCTL interface that this module wraps.
 
 Dependencies: 
-    - pywin32 (win32file, win32con) for Windows API access
-    - ctypes for low-level memory operations
+    - pywin32 (win32file, win32con) for opening/closing the device handle
+    - ctypes for the DeviceIoControl call itself and low-level buffers
     - Windows operating system (IOCTL is Windows-specific)
 
 Technical note: This implementation matches the protocol used by SXMOscilloscope.py
@@ -25,8 +25,15 @@ to ensure compatibility with existing Anfatec software.
 """
 
 import ctypes
-from ctypes import c_long
-import win32file, win32con
+import time
+import weakref
+from ctypes import c_long, c_void_p
+from ctypes import wintypes
+from enum import IntEnum
+from typing import Sequence
+
+import numpy as np
+import win32file, win32con, win32event
 
 # ---- Windows IOCTL Control Code Generation ----
 # These constants define how to construct the control code for the IOCTL call
@@ -67,6 +74,109 @@ def CTL_CODE(DeviceType, Access, Function_code, Method):
 # Function code 0xF0D is defined by Anfatec's driver specification
 IOCTL_GET_KANAL = CTL_CODE(FILE_DEVICE_UNKNOWN, FILE_ANY_ACCESS, 0xF0D, METHOD_BUFFERED)
 IOCTL_SET_CHANNEL = CTL_CODE(FILE_DEVICE_UNKNOWN, FILE_ANY_ACCESS, 0xF18, METHOD_BUFFERED)
+# ---- Direct kernel32 binding ----
+# DeviceIoControl is called through ctypes rather than win32file: pywin32 builds
+# a new bytes object for every output buffer and marshals each argument, while
+# this binding works on buffers that are allocated once and passed by address.
+# Pointer arguments are declared as c_void_p so plain integer addresses can be
+# passed without creating byref() objects on every call.
+_kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+_DeviceIoControl = _kernel32.DeviceIoControl
+_DeviceIoControl.argtypes = (
+    wintypes.HANDLE,   # hDevice
+    wintypes.DWORD,    # dwIoControlCode
+    c_void_p,          # lpInBuffer
+    wintypes.DWORD,    # nInBufferSize
+    c_void_p,          # lpOutBuffer
+    wintypes.DWORD,    # nOutBufferSize
+    c_void_p,          # lpBytesReturned
+    c_void_p,          # lpOverlapped
+)
+_DeviceIoControl.restype = wintypes.BOOL
+
+
+class OVERLAPPED(ctypes.Structure):
+    """Win32 OVERLAPPED (the Offset/OffsetHigh vs. Pointer union is laid out as two DWORDs)."""
+    _fields_ = [
+        ("Internal", ctypes.c_size_t),      # NTSTATUS of the request (STATUS_PENDING while running)
+        ("InternalHigh", ctypes.c_size_t),  # Bytes transferred
+        ("Offset", wintypes.DWORD),
+        ("OffsetHigh", wintypes.DWORD),
+        ("hEvent", wintypes.HANDLE),        # Signalled when the request completes
+    ]
+
+
+_GetOverlappedResult = _kernel32.GetOverlappedResult
+_GetOverlappedResult.argtypes = (wintypes.HANDLE, c_void_p, c_void_p, wintypes.BOOL)
+_GetOverlappedResult.restype = wintypes.BOOL
+
+# Not available on very old Windows versions; overlapped I/O still works without it
+try:
+    _SetFileCompletionNotificationModes = _kernel32.SetFileCompletionNotificationModes
+    _SetFileCompletionNotificationModes.argtypes = (wintypes.HANDLE, ctypes.c_ubyte)
+    _SetFileCompletionNotificationModes.restype = wintypes.BOOL
+except AttributeError:
+    _SetFileCompletionNotificationModes = None
+
+class OVERLAPPED_ENTRY(ctypes.Structure):
+    """One completion packet returned by GetQueuedCompletionStatusEx."""
+    _fields_ = [
+        ("lpCompletionKey", ctypes.c_size_t),
+        ("lpOverlapped", c_void_p),
+        ("Internal", ctypes.c_size_t),
+        ("dwNumberOfBytesTransferred", wintypes.DWORD),
+    ]
+
+
+_CreateIoCompletionPort = _kernel32.CreateIoCompletionPort
+_CreateIoCompletionPort.argtypes = (wintypes.HANDLE, wintypes.HANDLE, ctypes.c_size_t, wintypes.DWORD)
+_CreateIoCompletionPort.restype = wintypes.HANDLE
+
+_GetQueuedCompletionStatusEx = _kernel32.GetQueuedCompletionStatusEx
+_GetQueuedCompletionStatusEx.argtypes = (
+    wintypes.HANDLE, c_void_p, wintypes.ULONG, c_void_p, wintypes.DWORD, wintypes.BOOL,
+)
+_GetQueuedCompletionStatusEx.restype = wintypes.BOOL
+
+_CancelIoEx = _kernel32.CancelIoEx
+_CancelIoEx.argtypes = (wintypes.HANDLE, c_void_p)
+_CancelIoEx.restype = wintypes.BOOL
+
+_CloseHandle = _kernel32.CloseHandle
+_CloseHandle.argtypes = (wintypes.HANDLE,)
+_CloseHandle.restype = wintypes.BOOL
+
+ERROR_IO_PENDING = 997                          # Request queued, completes asynchronously
+WAIT_TIMEOUT = 258                              # GetQueuedCompletionStatusEx timed out
+STATUS_PENDING = 0x103                          # OVERLAPPED.Internal while the request runs
+OV_POOL_SIZE = 16                               # Max. outstanding submit_read() requests
+FILE_SKIP_COMPLETION_PORT_ON_SUCCESS = 0x1      # Inline completions post no IOCP packet
+FILE_SKIP_SET_EVENT_ON_HANDLE = 0x2             # Do not signal the file handle itself
+
+
+def _close_handles(handles: list) -> None:
+    """
+    Close every handle in `handles` (pywin32 PyHANDLEs or raw kernel32 ints).
+
+    Runs from SXMIOCTL.close() or from its weakref finalizer when the instance
+    is collected; errors are ignored since nothing can act on them there.
+    """
+    for h in handles:
+        try:
+            if isinstance(h, int):
+                _CloseHandle(h)
+            else:
+                win32file.CloseHandle(h)
+        except Exception:
+            pass
+    handles.clear()
+
+
+class _WriteBuf(ctypes.Structure):
+    """IOCTL_SET_CHANNEL input: two 32-bit signed ints (channel index, counts), like struct '<ll'."""
+    _pack_ = 1
+    _fields_ = [("idx", ctypes.c_int32), ("cnt", ctypes.c_int32)]
+
 # ---- SXM Driver Device Path ----
 # This is the Windows device path for the SXM driver
 # DEVICE_PATH is the symbolic link created by the Anfatec driver
@@ -135,6 +245,21 @@ CHANNELS = {
     'minmax':     ( 47, 'ADC21',    'A',  3.35e-07)      # Min/max detector output
 }
 
+# ---- Channel tables, built once at import ----
+# Ch is the single name -> dense channel id map: an IntEnum whose members are
+# named like the CHANNELS keys (functional API, since names like 'x-direction'
+# are not identifiers) and numbered in CHANNELS order: Ch['Frequency'], Ch(5).
+# CH_IDX / CH_SCALE hold driver index and scale per id as contiguous arrays, so
+# read_many() gathers a whole frame's scales with one fancy index. The list
+# views are derived from them for single-channel reads, where indexing a list
+# beats a numpy scalar and yields the plain int that read_raw() needs.
+Ch = IntEnum('Ch', [(name, i) for i, name in enumerate(CHANNELS)])
+CH_IDX = np.fromiter((ch[0] for ch in CHANNELS.values()), dtype=np.int32, count=len(CHANNELS))
+CH_SCALE = np.fromiter((ch[3] for ch in CHANNELS.values()), dtype=np.float64, count=len(CHANNELS))
+_CH_ID = Ch.__members__          # name -> Ch member
+_IDX_LIST = CH_IDX.tolist()      # id -> driver index (int)
+_SCALE_LIST = CH_SCALE.tolist()  # id -> scale factor (float)
+
 
 class SXMIOCTL:
     """
@@ -155,8 +280,20 @@ class SXMIOCTL:
         2. Read channels by name using read_scaled()
         3. Instance automatically closes driver on cleanup
     """
-    
-    def __init__(self, device_path: str = DEVICE_PATH):
+
+    # Fixed attribute set: no per-instance __dict__, slot access on the read path
+    __slots__ = (
+        "handle", "_hdev",
+        "_inbuf", "_out", "_bytes", "_inbuf_addr", "_out_addr", "_bytes_addr",
+        "_wbuf", "_wbuf_addr",
+        "_event", "_ov", "_ov_addr",
+        "_port", "_pool_in", "_pool_out", "_pool_ov", "_pool_addrs", "_pool_free",
+        "_entries", "_removed",
+        "_names_cache", "_cache",
+        "_handles", "_finalizer", "__weakref__",
+    )
+
+    def __init__(self, device_path: str = DEVICE_PATH, overlapped: bool = False):
         """
         Initialize connection to the SXM driver.
         
@@ -165,6 +302,12 @@ class SXMIOCTL:
         
         Args:
             device_path: Windows device path (default: "backslash SXM")
+            overlapped: Open the handle with FILE_FLAG_OVERLAPPED (default: False,
+                plain synchronous I/O). Requests that the driver completes inline
+                then return at once without queuing completion work; pending ones
+                are waited on. Also needed for submit_read()/complete() and the
+                pipelined read_many(). Opt-in, since the vendor driver's
+                overlapped behaviour has not been verified.
             
         Raises:
             Exception: If driver cannot be opened (common causes:
@@ -180,46 +323,93 @@ class SXMIOCTL:
         # GENERIC_READ|WRITE: Request both read and write access
         # OPEN_EXISTING: Device must already exist (driver must be loaded)
         # FILE_ATTRIBUTE_NORMAL: Standard file attributes
+        # FILE_FLAG_OVERLAPPED: Asynchronous-capable handle (see `overlapped`)
+        flags = win32con.FILE_ATTRIBUTE_NORMAL
+        if overlapped:
+            flags |= win32file.FILE_FLAG_OVERLAPPED
         self.handle = win32file.CreateFile(
             device_path,
             win32con.GENERIC_READ | win32con.GENERIC_WRITE,
             0,                                    # No sharing
             None,                                 # Default security
             win32con.OPEN_EXISTING,               # Must exist
-            win32con.FILE_ATTRIBUTE_NORMAL,       # Normal attributes
+            flags,                                # Normal attributes (+ overlapped)
             None                                  # No template file
         )
         
-        # Pre-allocate input buffer for channel index
-        # IOCTL calls require a buffer to pass the channel index to the driver
-        # We allocate this once and reuse it for efficiency
-        self._inbuf = ctypes.create_string_buffer(ctypes.sizeof(c_long))
+        # Raw handle value for the ctypes DeviceIoControl binding
+        self._hdev = int(self.handle)
+
+        # One OVERLAPPED (with its own manual-reset event) reused for every request.
+        # Skipping the completion-port packet and the handle event for requests
+        # that complete inline means those cost a single kernel transition.
+        self._event = None
+        self._ov = None
+        self._ov_addr = None  # None -> synchronous DeviceIoControl
+        if overlapped:
+            self._event = win32event.CreateEvent(None, True, False, None)
+            self._ov = OVERLAPPED()
+            self._ov.hEvent = int(self._event)
+            self._ov_addr = ctypes.addressof(self._ov)
+            if _SetFileCompletionNotificationModes is not None:
+                _SetFileCompletionNotificationModes(
+                    self._hdev,
+                    FILE_SKIP_COMPLETION_PORT_ON_SUCCESS | FILE_SKIP_SET_EVENT_ON_HANDLE,
+                )
+
+        # Pre-allocate the IOCTL buffers once and reuse them for every read:
+        # input (channel index), output (raw value) and the returned byte count.
+        # Their addresses are cached so read_raw() passes plain integers.
+        self._inbuf = c_long(0)
+        self._out = c_long(0)
+        self._bytes = wintypes.DWORD(0)
+        self._inbuf_addr = ctypes.addressof(self._inbuf)
+        self._out_addr = ctypes.addressof(self._out)
+        self._bytes_addr = ctypes.addressof(self._bytes)
+
+        # Reusable IOCTL_SET_CHANNEL input buffer, filled in place by write_raw()
+        self._wbuf = _WriteBuf()
+        self._wbuf_addr = ctypes.addressof(self._wbuf)
+
+        # Pool for pipelined submit_read()/complete(); created on first use
+        self._port = None
+
+        # read_many() plans: tuple of names -> (driver indices, float64 scale array)
+        self._names_cache = {}
+
+        # read_scaled_cached(): name -> (value, time.monotonic_ns() of the read)
+        self._cache = {}
+
+        # Every OS handle this instance owns; the finalizer closes them when the
+        # instance is collected (or on close()), without a __del__ method.
+        self._handles = [self.handle]
+        if self._event is not None:
+            self._handles.append(self._event)
+        self._finalizer = weakref.finalize(self, _close_handles, self._handles)
 
     def close(self):
         """
         Explicitly close the driver connection.
         
-        While the destructor will also close the handle, it's good practice
-        to explicitly close resources when you're done with them.
+        While the finalizer will also close the handles when the instance is
+        garbage collected, it's good practice to explicitly close resources
+        when you're done with them. Calling close() more than once is harmless.
         """
-        if self.handle:
-            win32file.CloseHandle(self.handle)
-            self.handle = None
+        self._finalizer()  # Runs _close_handles() at most once
+        self.handle = None
+        self._event = None
+        self._port = None
+        # Never pass the old handle value on: the OS may reuse it. Handle 0 is
+        # never valid, so any later call fails and reports the closed state.
+        self._hdev = 0
+        self._ov_addr = None
 
-    def __del__(self):
-        """
-        Destructor ensures driver handle is closed during garbage collection.
-        
-        This provides automatic cleanup if the user forgets to call close()
-        explicitly. The try/except ensures no exceptions during cleanup.
-        """
-        try:
-            self.close()
-        except Exception:
-            # Ignore cleanup errors - object is being destroyed anyway
-            pass
+    def _check_open(self) -> None:
+        """Raise ValueError if close() has been called."""
+        if not self._hdev:
+            raise ValueError("SXMIOCTL is closed")
 
-    def read_raw(self, channel_index: int) -> int:
+    def read_raw(self, channel_index: int, *, _DIOCTL=_DeviceIoControl, _IOCTL=IOCTL_GET_KANAL) -> int:
         """
         Read raw integer value from a specific driver channel.
         
@@ -237,31 +427,163 @@ class SXMIOCTL:
             Exception: If IOCTL call fails (driver error, invalid channel, etc.)
             
         Technical details:
-            1. Puts channel_index into input buffer as a C long integer
-            2. Calls DeviceIoControl with IOCTL_GET_KANAL control code
-            3. Driver returns 4 bytes containing the raw channel value
-            4. Converts bytes back to C long integer
-        """
-        # Copy channel index into the pre-allocated input buffer
-        # This converts Python int to C long in the buffer format expected by driver
-        ctypes.memmove(
-            self._inbuf, 
-            ctypes.byref(c_long(channel_index)), 
-            ctypes.sizeof(c_long)
-        )
-        
+            1. Stores channel_index in the pre-allocated input c_long
+            2. Calls kernel32 DeviceIoControl with IOCTL_GET_KANAL control code
+            3. Driver writes 4 bytes (the raw channel value) into the output c_long
+            4. Returns the output c_long's value (no intermediate bytes object)
+
+        The keyword-only `_DIOCTL`/`_IOCTL` defaults bind the module-level
+        DeviceIoControl function and control code once at definition time, so
+        the hot path reads them as locals instead of globals. Do not pass them.
+        """
+        # Put the channel index into the pre-allocated input buffer
+        self._inbuf.value = channel_index
+
         # Execute the IOCTL call to read channel data
         # DeviceIoControl sends control code + input buffer to driver
-        # Driver processes request and returns output buffer with channel value
-        out = win32file.DeviceIoControl(
-            self.handle,              # Device handle
-            IOCTL_GET_KANAL,         # Control code (what operation to perform)
-            self._inbuf,             # Input buffer (channel index)
-            ctypes.sizeof(c_long)    # Expected output size (4 bytes for long)
-        )
-        
-        # Convert output bytes back to a C long integer
-        return c_long.from_buffer_copy(out).value
+        # Driver processes request and fills the output buffer with channel value
+        if not _DIOCTL(
+            self._hdev,              # Device handle
+            _IOCTL,                  # Control code (what operation to perform)
+            self._inbuf_addr, 4,     # Input buffer (channel index)
+            self._out_addr, 4,       # Output buffer (raw value, 4 bytes for long)
+            self._bytes_addr,        # Bytes returned
+            self._ov_addr,           # Reused OVERLAPPED, or None for synchronous I/O
+        ):
+            self._wait_pending()
+
+        return self._out.value
+
+    def _wait_pending(self) -> None:
+        """
+        Finish a DeviceIoControl call that returned FALSE.
+
+        On an overlapped handle, ERROR_IO_PENDING means the driver queued the
+        request: block on its OVERLAPPED until it completes. Any other error
+        (or a failure on a synchronous handle) is raised as OSError.
+        """
+        err = ctypes.get_last_error()
+        self._check_open()  # Report a closed instance rather than ERROR_INVALID_HANDLE
+        if err != ERROR_IO_PENDING or self._ov_addr is None:
+            raise ctypes.WinError(err)
+        if not _GetOverlappedResult(self._hdev, self._ov_addr, self._bytes_addr, True):
+            raise ctypes.WinError(ctypes.get_last_error())
+
+    def _ensure_pool(self) -> None:
+        """
+        Set up the OVERLAPPED pool and its I/O completion port (once).
+
+        Each pool slot owns an input c_long, an output c_long and an OVERLAPPED,
+        so up to OV_POOL_SIZE reads can be in flight at the same time.
+        """
+        if self._port is not None:
+            return
+        self._check_open()
+        if self._ov_addr is None:
+            raise RuntimeError("Pipelined reads need a handle opened with overlapped=True")
+        port = _CreateIoCompletionPort(self._hdev, None, 0, 1)
+        if not port:
+            raise ctypes.WinError(ctypes.get_last_error())
+        self._port = port
+        self._handles.append(port)
+
+        # Keep the synchronous read_raw()/write_raw() path off the port: an event
+        # handle with the low bit set suppresses the completion packet.
+        self._ov.hEvent = int(self._event) | 1
+
+        self._pool_in = (c_long * OV_POOL_SIZE)()
+        self._pool_out = (c_long * OV_POOL_SIZE)()
+        self._pool_ov = (OVERLAPPED * OV_POOL_SIZE)()
+        size_l, size_ov = ctypes.sizeof(c_long), ctypes.sizeof(OVERLAPPED)
+        base_in, base_out, base_ov = (ctypes.addressof(a) for a in (self._pool_in, self._pool_out, self._pool_ov))
+        self._pool_addrs = [
+            (base_in + i * size_l, base_out + i * size_l, base_ov + i * size_ov)
+            for i in range(OV_POOL_SIZE)
+        ]
+        self._pool_free = list(range(OV_POOL_SIZE))
+        self._entries = (OVERLAPPED_ENTRY * OV_POOL_SIZE)()
+        self._removed = wintypes.ULONG(0)
+
+    def submit_read(self, channel_index: int) -> int:
+        """
+        Start reading a raw channel value without waiting for it.
+
+        Args:
+            channel_index: Hardware channel index (can be negative for DACs)
+
+        Returns:
+            Ticket to pass to complete() for the value
+
+        Raises:
+            RuntimeError: If OV_POOL_SIZE reads are already outstanding
+            OSError: If the driver rejects the request
+        """
+        self._ensure_pool()
+        if not self._pool_free:
+            raise RuntimeError(f"More than {OV_POOL_SIZE} outstanding IOCTL reads")
+        slot = self._pool_free.pop()
+        in_addr, out_addr, ov_addr = self._pool_addrs[slot]
+        self._pool_in[slot] = channel_index
+        if not _DeviceIoControl(self._hdev, IOCTL_GET_KANAL, in_addr, 4, out_addr, 4, None, ov_addr):
+            err = ctypes.get_last_error()
+            if err != ERROR_IO_PENDING:
+                self._pool_free.append(slot)
+                raise ctypes.WinError(err)
+        return slot
+
+    def complete(self, ticket: int, timeout_ms: int = 1000) -> int:
+        """
+        Wait for a submit_read() request and return its raw value.
+
+        Requests that already finished (inline, or in the meantime) are detected
+        from OVERLAPPED.Internal without any system call; only still-pending
+        ones wait on the completion port.
+
+        Raises:
+            TimeoutError: If the request did not finish within timeout_ms
+            OSError: If the driver reported an error for the request
+        """
+        ov = self._pool_ov[ticket]
+        try:
+            if not self._wait_slot(ov, timeout_ms):
+                raise TimeoutError(f"IOCTL read {ticket} still pending after {timeout_ms} ms")
+            if not _GetOverlappedResult(self._hdev, self._pool_addrs[ticket][2], self._bytes_addr, False):
+                raise ctypes.WinError(ctypes.get_last_error())
+            return self._pool_out[ticket]
+        finally:
+            if ov.Internal == STATUS_PENDING:
+                # Timed out: cancel the request and wait for the cancellation
+                # so its buffers are free again before the slot is reused
+                _CancelIoEx(self._hdev, self._pool_addrs[ticket][2])
+                try:
+                    self._wait_slot(ov, timeout_ms)
+                except OSError:
+                    pass
+            # A request the driver never finishes still owns its buffers; only
+            # finished (or cancelled) slots go back to the pool
+            if ov.Internal != STATUS_PENDING:
+                self._pool_free.append(ticket)
+
+    def _wait_slot(self, ov: OVERLAPPED, timeout_ms: int) -> bool:
+        """
+        Drain completion packets (for any slot) until `ov` is no longer pending.
+
+        Returns:
+            True once the request finished, False if timeout_ms passed first
+
+        Raises:
+            OSError: If waiting on the completion port failed
+        """
+        while ov.Internal == STATUS_PENDING:
+            if not _GetQueuedCompletionStatusEx(
+                self._port, ctypes.addressof(self._entries), OV_POOL_SIZE,
+                ctypes.addressof(self._removed), timeout_ms, False,
+            ):
+                err = ctypes.get_last_error()
+                if err == WAIT_TIMEOUT:
+                    return False
+                raise ctypes.WinError(err)
+        return True
 
     def read_scaled(self, name: str) -> float:
         """
@@ -287,28 +609,162 @@ class SXMIOCTL:
             amplitude_volts = sxm.read_scaled('QPlusAmpl')   # Returns V
             phase_degrees = sxm.read_scaled('Phase')         # Returns degrees
         """
-        # Look up channel configuration
-        if name not in CHANNELS:
+        # Look up the channel id; only an unknown name pays for the error message
+        try:
+            i = _CH_ID[name]
+        except KeyError:
             available = list(CHANNELS.keys())
-            raise KeyError(f"Unknown channel '{name}'. Available channels: {available}")
-        
-        # Extract channel parameters
-        idx, _short, _unit, scale = CHANNELS[name]
-        
-        # Read raw value from driver
-        raw = self.read_raw(idx)
-        
-        # Apply calibration scaling to get physical units
-        # Raw driver values are integers; scaling converts to physical units
-        return float(raw) * float(scale)
-        
+            raise KeyError(f"Unknown channel '{name}'. Available channels: {available}") from None
+
+        # Read raw value from driver and apply calibration scaling
+        # Raw driver values are integers; the precomputed float scale converts to physical units
+        return self.read_raw(_IDX_LIST[i]) * _SCALE_LIST[i]
+
+    def read_ch(self, ch: Ch) -> float:
+        """
+        Read a channel identified by its Ch member and return it in physical units.
+
+        Same result as read_scaled(ch.name), but the index and scale are two
+        list loads instead of hashing the channel name.
+
+        Args:
+            ch: Channel id, e.g. Ch['Frequency'] (resolve once, reuse every tick)
+
+        Returns:
+            Channel value in physical units
+
+        Raises:
+            Exception: If driver read fails
+        """
+        return self.read_raw(_IDX_LIST[ch]) * _SCALE_LIST[ch]
+
+    def read_scaled_cached(self, name: str, max_age_ms: float) -> float:
+        """
+        Like read_scaled(), but reuse the last value if it is recent enough.
+
+        Meant for slowly varying channels that are polled at GUI rate (e.g.
+        'Bias'): within `max_age_ms` of the last driver read the cached value
+        is returned without an IOCTL call.
+
+        Args:
+            name: Channel name (key of CHANNELS)
+            max_age_ms: Maximum age of a cached value in milliseconds
+
+        Returns:
+            Channel value in physical units
+
+        Raises:
+            KeyError: If channel name is not recognized
+            Exception: If driver read fails
+        """
+        now = time.monotonic_ns()
+        hit = self._cache.get(name)
+        if hit is not None and now - hit[1] < max_age_ms * 1_000_000:
+            return hit[0]
+        value = self.read_scaled(name)
+        self._cache[name] = (value, now)
+        return value
+
+    def reader(self, name: str):
+        """
+        Return a zero-argument function that reads one channel in physical units.
+
+        The channel index, scale and bound read_raw are captured once, so each
+        call skips the name lookups of read_scaled(). Intended for polling loops:
+
+            read_freq = sxm.reader('Frequency')
+            ...
+            freq_hz = read_freq()   # every tick
+
+        Raises:
+            KeyError: If channel name is not recognized
+        """
+        try:
+            i = _CH_ID[name]
+        except KeyError:
+            available = list(CHANNELS.keys())
+            raise KeyError(f"Unknown channel '{name}'. Available channels: {available}") from None
+        idx, scale = _IDX_LIST[i], _SCALE_LIST[i]
+        read_raw = self.read_raw
+        return lambda: read_raw(idx) * scale
+
+    def read_many(self, names: Sequence[str]) -> np.ndarray:
+        """
+        Read several channels by name and return them in physical units.
+
+        Each distinct list of names is resolved once into its driver indices and
+        a float64 scale array; later calls only do the IOCTL reads and a single
+        vectorized multiply.
+
+        Args:
+            names: Channel names (keys of CHANNELS), e.g. ('Frequency', 'Drive', 'df')
+
+        Returns:
+            float64 array with one scaled value per name, in the given order
+
+        Raises:
+            KeyError: If a channel name is not recognized
+            Exception: If a driver read fails
+        """
+        key = tuple(names)
+        plan = self._names_cache.get(key)
+        if plan is None:
+            unknown = [n for n in key if n not in _CH_ID]
+            if unknown:
+                available = list(CHANNELS.keys())
+                raise KeyError(f"Unknown channel(s) {unknown}. Available channels: {available}")
+            ids = [_CH_ID[n] for n in key]
+            # Indices become Python ints: read_raw() assigns them straight into a c_long
+            plan = (tuple(CH_IDX[ids].tolist()), CH_SCALE[ids])
+            self._names_cache[key] = plan
+        indices, scales = plan
+
+        # Read raw values into a preallocated array, then scale all at once.
+        # On an overlapped handle the reads are pipelined through the pool.
+        out = np.empty(len(indices), dtype=np.float64)
+        if self._ov_addr is not None and len(indices) > 1:
+            submit, complete = self.submit_read, self.complete
+            for start in range(0, len(indices), OV_POOL_SIZE):
+                tickets = []
+                done = 0  # Tickets handed to complete(), which always settles its slot
+                try:
+                    for idx in indices[start:start + OV_POOL_SIZE]:
+                        tickets.append(submit(idx))
+                    for ticket in tickets:
+                        done += 1
+                        out[start + done - 1] = complete(ticket)
+                finally:
+                    # After an error, finish the requests still in flight so
+                    # their slots return to the pool
+                    for ticket in tickets[done:]:
+                        try:
+                            complete(ticket)
+                        except Exception:
+                            pass
+        else:
+            read_raw = self.read_raw
+            for i, idx in enumerate(indices):
+                out[i] = read_raw(idx)
+        out *= scales
+        return out
+
     def write_raw(self, write_index: int, counts: int) -> None:
         """
         Write a 32-bit signed integer to a driver channel (DAC).
+
+        The (index, counts) pair is written into the pre-allocated _WriteBuf
+        structure instead of packing a new bytes object per call.
         """
-        import struct
-        buf = struct.pack("<ll", int(write_index), int(counts))
-        win32file.DeviceIoControl(self.handle, IOCTL_SET_CHANNEL, buf, 0)
+        wbuf = self._wbuf
+        wbuf.idx = int(write_index)
+        wbuf.cnt = int(counts)
+        if not _DeviceIoControl(
+            self._hdev, IOCTL_SET_CHANNEL,
+            self._wbuf_addr, ctypes.sizeof(_WriteBuf),   # Input: index + counts
+            None, 0,                                     # No output
+            self._bytes_addr, self._ov_addr,
+        ):
+            self._wait_pending()
 
     def write_unit(self, name: str, value: float) -> int:
         """
@@ -323,4 +779,31 @@ class SXMIOCTL:
         write_id = 0
         counts = int(round(float(value) / float(scale)))
         self.write_raw(write_id, counts)
-        return counts
\ No newline at end of file
+        return counts
+
+    def writer(self, name: str):
+        """
+        Return a one-argument function that writes a value in physical units.
+
+        The write id and inverse scale are resolved once, so each call is a
+        multiply, a round and write_raw(); like write_unit(), it writes id 0
+        and returns the counts sent. Intended for knobs that write repeatedly:
+
+            set_topo = sxm.writer('Topo')
+            ...
+            set_topo(10.0)   # every change
+
+        Raises:
+            KeyError: If channel name is not recognized
+        """
+        if name not in CHANNELS:
+            raise KeyError(name)
+        inv = 1.0 / _SCALE_LIST[_CH_ID[name]]
+        write_raw = self.write_raw
+
+        def write(value: float) -> int:
+            counts = int(round(float(value) * inv))
+            write_raw(0, counts)
+            return counts
+
+        return write
\ No newline at end of file
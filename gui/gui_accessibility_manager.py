@@ -27,11 +27,75 @@ Graduate students and researchers working with microscopy GUIs. Focus is on
 clarity, usability, and reproducibility, with minimal software abstraction.
 """
 
+import bisect
 import json
 import os
 from PyQt5 import QtWidgets, QtCore, QtGui
 import pyqtgraph as pg
 
+# Compact encoder for the settings file (no indent: uses the C encoder path)
+_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+# Axis pens for light/dark plots, built once (AxisItem copies the pen it is given)
+_BLACK_PEN = pg.mkPen("k")
+_WHITE_PEN = pg.mkPen("w")
+
+# Stylesheets applied by AccessibilityManager. Module constants, so every call
+# passes the same string and an unchanged stylesheet is not set (and re-polished)
+# again.
+_HC_QSS = """
+    QWidget { background-color: white; color: black; }
+    QPushButton { background-color: #f0f0f0; border: 2px solid #333; padding: 6px; font-weight: bold; }
+    QPushButton:pressed { background-color: #e0e0e0; }
+    QLabel { color: black; font-weight: bold; }
+    QComboBox, QSpinBox, QDoubleSpinBox, QLineEdit {
+        background-color: white; border: 2px solid #333; font-weight: bold;
+    }
+    QTabWidget::pane { border: 1px solid #333; }
+    QTabBar::tab { background: #f0f0f0; color: black; padding: 6px; }
+    QTabBar::tab:selected { background: #ddd; }
+    QTabBar::tab:hover { background: #eee; }
+    QTableWidget, QTableView {
+        background-color: white; alternate-background-color: #f9f9f9;
+        color: black; gridline-color: #333;
+    }
+    QHeaderView::section {
+        background-color: #f0f0f0; color: black; border: 1px solid #333;
+    }
+"""
+
+_DARK_QSS = """
+    QWidget { background-color: #121212; color: #f0f0f0; }
+    QPushButton { background-color: #333; border: 1px solid #555; padding: 6px; }
+    QPushButton:pressed { background-color: #444; }
+    QLabel { color: #f0f0f0; }
+    QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox {
+        background-color: #222; color: #f0f0f0; border: 1px solid #555;
+    }
+    QTabWidget::pane { border: 1px solid #444; }
+    QTabBar::tab { background: #333; color: #f0f0f0; padding: 6px; }
+    QTabBar::tab:selected { background: #555; }
+    QTabBar::tab:hover { background: #444; }
+    QTableWidget, QTableView {
+        background-color: #121212; alternate-background-color: #1e1e1e;
+        color: #f0f0f0; gridline-color: #444;
+        selection-background-color: #333366; selection-color: #ffffff;
+    }
+    QHeaderView::section {
+        background-color: #222; color: #f0f0f0; border: 1px solid #444;
+    }
+    QGroupBox {
+        border: 1px solid #444; margin-top: 6px;
+    }
+    QGroupBox:title {
+        subcontrol-origin: margin; left: 7px; padding: 0 3px 0 3px;
+        color: #f0f0f0;
+    }
+    QGraphicsView {
+        background-color: #121212; border: 1px solid #444;
+    }
+"""
+
 
 class AccessibilityManager(QtCore.QObject):
     """
@@ -84,9 +148,37 @@ class AccessibilityManager(QtCore.QObject):
             "Huge": 1.8,
             "Maximum": 2.2,
         }
+        # Reverse lookup and ordered scales for scale_name()/next_scale_name()
+        self._scale_to_name = {v: k for k, v in self.scale_options.items()}
+        self._scales_sorted = sorted(self.scale_options.values())
+
+        # Bumped on every settings change; widgets compare it with the version
+        # they last applied to skip redundant re-applies (see AccessibleWidget)
+        self._version = 0
+
+        # Application and its default point size (sampled on first use and
+        # again after each font scale change) for get_scaled_font()
+        self._app = QtWidgets.QApplication.instance()
+        self._base_point_size = None
+
+        # Scaled fonts by (point size, family), shared by all widgets and plot
+        # axes; setFont()/setTickFont() copy the QFont, so sharing is safe.
+        self._font_cache = {}
+        # Installed font families, read once from QFontDatabase on first use
+        self._families = None
 
         self.load_settings()
 
+        # Debounced writer: bursts of setter calls (scrubbing the font combo,
+        # repeated shortcuts) collapse into one disk write after the last one.
+        self._save_timer = QtCore.QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(300)
+        self._save_timer.timeout.connect(self._flush_settings)
+        app = QtCore.QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._flush_pending)
+
     # ---------------- Settings I/O ----------------
     def load_settings(self):
         """
@@ -104,12 +196,38 @@ class AccessibilityManager(QtCore.QObject):
 
     def save_settings(self):
         """
-        Save current accessibility settings to JSON file.
+        Schedule saving the current accessibility settings to the JSON file.
+
+        The write happens 300 ms after the last call (restarting the timer),
+        or at application shutdown if still pending.
+        """
+        self._save_timer.start()
+
+    def _flush_pending(self):
+        """Write settings now if a debounced save is still pending."""
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._flush_settings()
+
+    def _flush_settings(self):
         """
+        Write current accessibility settings to JSON file.
+
+        Writes a sibling ``.tmp`` file and swaps it in with os.replace, so an
+        interrupted write leaves the previous settings file intact.
+        """
+        tmp = self.settings_file + ".tmp"
         try:
-            with open(self.settings_file, "w") as f:
-                json.dump(self.settings, f, indent=2)
+            with open(tmp, "w") as f:
+                f.write(_ENCODER.encode(self.settings))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.settings_file)
         except Exception as e:
+            try:
+                os.remove(tmp)  # Don't leave a partial file behind
+            except OSError:
+                pass
             print(f"Could not save accessibility settings: {e}")
 
     # ---------------- Setters ----------------
@@ -125,10 +243,16 @@ class AccessibilityManager(QtCore.QObject):
         Returns
         -------
         bool
-            True if applied successfully, False if invalid name.
+            True if applied successfully (or already set), False if invalid name.
         """
         if scale_name in self.scale_options:
-            self.settings["font_scale"] = self.scale_options[scale_name]
+            scale = self.scale_options[scale_name]
+            if self.settings["font_scale"] == scale:
+                return True  # Unchanged: no save, no restyle
+            self.settings["font_scale"] = scale
+            self._font_cache.clear()  # Old sizes will not be asked for again
+            self._base_point_size = None
+            self._version += 1
             self.save_settings()
             self.settings_changed.emit(self.settings)
             return True
@@ -143,7 +267,11 @@ class AccessibilityManager(QtCore.QObject):
         enabled : bool
             Whether high contrast mode should be enabled.
         """
-        self.settings["high_contrast"] = bool(enabled)
+        enabled = bool(enabled)
+        if self.settings["high_contrast"] == enabled:
+            return  # Unchanged (e.g. a toolbar button echoing the setting)
+        self.settings["high_contrast"] = enabled
+        self._version += 1
         self.save_settings()
         self.settings_changed.emit(self.settings)
 
@@ -156,11 +284,49 @@ class AccessibilityManager(QtCore.QObject):
         enabled : bool
             Whether dark mode should be enabled.
         """
-        self.settings["dark_mode"] = bool(enabled)
+        enabled = bool(enabled)
+        if self.settings["dark_mode"] == enabled:
+            return  # Unchanged (e.g. a toolbar button echoing the setting)
+        self.settings["dark_mode"] = enabled
+        self._version += 1
         self.save_settings()
         self.settings_changed.emit(self.settings)
 
     # ---------------- Helpers ----------------
+    def scale_name(self, scale: float):
+        """
+        Return the preset name for a font scale factor.
+
+        Parameters
+        ----------
+        scale : float
+            Font scale factor, e.g. ``settings["font_scale"]``.
+
+        Returns
+        -------
+        str or None
+            Matching name from `scale_options`, or None if it is not a preset.
+        """
+        return self._scale_to_name.get(round(scale, 2))
+
+    def next_scale_name(self, scale: float):
+        """
+        Return the name of the next larger preset scale, or None at the maximum.
+        """
+        i = bisect.bisect_right(self._scales_sorted, scale + 0.01)
+        if i < len(self._scales_sorted):
+            return self._scale_to_name[self._scales_sorted[i]]
+        return None
+
+    def prev_scale_name(self, scale: float):
+        """
+        Return the name of the next smaller preset scale, or None at the minimum.
+        """
+        i = bisect.bisect_left(self._scales_sorted, scale - 0.01)
+        if i > 0:
+            return self._scale_to_name[self._scales_sorted[i - 1]]
+        return None
+
     def get_scaled_font(self, base_size: int = None) -> QtGui.QFont:
         """
         Return a QFont object scaled by current font factor.
@@ -169,18 +335,31 @@ class AccessibilityManager(QtCore.QObject):
         ----------
         base_size : int, optional
             Base font size. Uses application default if None.
+            The family from ``settings["font_family"]`` is used unless it is
+            "default" or not installed.
 
         Returns
         -------
         QtGui.QFont
-            Scaled font.
+            Scaled font. Cached and shared between callers; do not modify it.
         """
-        app = QtWidgets.QApplication.instance()
         if base_size is None:
-            base_size = app.font().pointSize() or 10
+            base_size = self._base_point_size
+            if base_size is None:
+                base_size = self._base_point_size = self._app.font().pointSize() or 10
         scaled = max(6, int(base_size * self.settings["font_scale"]))
-        font = QtGui.QFont()
-        font.setPointSize(scaled)
+        family = self.settings["font_family"]
+        key = (scaled, family)
+        font = self._font_cache.get(key)
+        if font is None:
+            font = QtGui.QFont()
+            font.setPointSize(scaled)
+            if family != "default":
+                if self._families is None:
+                    self._families = frozenset(QtGui.QFontDatabase().families())
+                if family in self._families:
+                    font.setFamily(family)
+            self._font_cache[key] = font
         return font
 
     def get_scaled_size(self, base_size: int) -> int:
@@ -209,33 +388,54 @@ class AccessibilityManager(QtCore.QObject):
         widget : QtWidgets.QWidget
             Target widget.
         """
-        # Update fonts
-        widget.setFont(self.get_scaled_font())
-        for child in widget.findChildren(QtWidgets.QWidget):
-            if not isinstance(child, (pg.PlotWidget, pg.GraphicsLayoutWidget)):
-                child.setFont(self.get_scaled_font())
-
-        # Update plots
-        for plot_widget in widget.findChildren(pg.PlotWidget):
-            self.apply_to_plot(plot_widget)
-
-        for glw in widget.findChildren(pg.GraphicsLayoutWidget):
-            for item in glw.ci.items.keys():
-                if isinstance(item, pg.PlotItem):
-                    self.apply_to_plotitem(item)
-            glw.setBackground("k" if self.settings.get("dark_mode", False) else "w")
-
-        # Update tables
-        for table in widget.findChildren(QtWidgets.QTableWidget):
-            self.apply_table_colors(table)
-
-        # Apply global styles
-        if self.settings.get("dark_mode", False):
-            self.apply_dark_mode_style(widget)
-        elif self.settings.get("high_contrast", False):
-            self.apply_high_contrast_style(widget)
-        else:
-            self.clear_styles(widget)
+        # Suspend painting while fonts/styles change, so Qt repaints once at
+        # the end instead of after every child.
+        was_enabled = widget.updatesEnabled()
+        widget.setUpdatesEnabled(False)
+        try:
+            dark = self.settings.get("dark_mode", False)
+            hc = self.settings.get("high_contrast", False)
+
+            # One walk over the widget tree: set fonts and sort out the plots
+            # and tables, which are styled afterwards (plots keep their fonts).
+            font = self.get_scaled_font()
+            widget.setFont(font)
+            plots, glws, tables = [], [], []
+            for child in widget.findChildren(QtWidgets.QWidget):
+                if isinstance(child, pg.PlotWidget):
+                    plots.append(child)
+                elif isinstance(child, pg.GraphicsLayoutWidget):
+                    glws.append(child)
+                else:
+                    child.setFont(font)
+                    if isinstance(child, QtWidgets.QTableWidget):
+                        tables.append(child)
+
+            # Update plots
+            for plot_widget in plots:
+                self.apply_to_plot(plot_widget)
+
+            for glw in glws:
+                # Graphics items hang off the layout via parentItem(), not the
+                # QObject tree, so findChildren() would miss them: walk the layout.
+                for item in glw.ci.items:
+                    if isinstance(item, pg.PlotItem):
+                        self.apply_to_plotitem(item)
+                glw.setBackground("k" if dark else "w")
+
+            # Update tables
+            for table in tables:
+                self.apply_table_colors(table)
+
+            # Apply global styles
+            if dark:
+                self.apply_dark_mode_style(widget)
+            elif hc:
+                self.apply_high_contrast_style(widget)
+            else:
+                self.clear_styles(widget)
+        finally:
+            widget.setUpdatesEnabled(was_enabled)
 
     def apply_to_plot(self, plot_widget: pg.PlotWidget):
         """
@@ -246,29 +446,9 @@ class AccessibilityManager(QtCore.QObject):
         plot_widget : pg.PlotWidget
             Target plot widget.
         """
-        tick_font = QtGui.QFont()
-        tick_font.setPointSize(self.get_scaled_size(9))
-        plot_widget.getAxis("bottom").setTickFont(tick_font)
-        plot_widget.getAxis("left").setTickFont(tick_font)
-
-        grid_alpha = (
-            0.5 if self.settings.get("high_contrast") else self.settings["grid_alpha"]
-        )
-
-        if self.settings.get("dark_mode", False):
-            plot_widget.setBackground("k")
-            plot_widget.getAxis("left").setTextPen("w")
-            plot_widget.getAxis("left").setPen(pg.mkPen("w"))
-            plot_widget.getAxis("bottom").setTextPen("w")
-            plot_widget.getAxis("bottom").setPen(pg.mkPen("w"))
-            plot_widget.showGrid(x=True, y=True, alpha=grid_alpha)
-        else:
-            plot_widget.setBackground("w")
-            plot_widget.getAxis("left").setTextPen("k")
-            plot_widget.getAxis("left").setPen(pg.mkPen("k"))
-            plot_widget.getAxis("bottom").setTextPen("k")
-            plot_widget.getAxis("bottom").setPen(pg.mkPen("k"))
-            plot_widget.showGrid(x=True, y=True, alpha=grid_alpha)
+        dark = self.settings.get("dark_mode", False)
+        plot_widget.setBackground("k" if dark else "w")
+        self._style_axes(plot_widget, dark)
 
     def apply_to_plotitem(self, plot_item: pg.PlotItem):
         """
@@ -279,29 +459,33 @@ class AccessibilityManager(QtCore.QObject):
         plot_item : pg.PlotItem
             Target plot item.
         """
-        tick_font = QtGui.QFont()
-        tick_font.setPointSize(self.get_scaled_size(9))
-        plot_item.getAxis("bottom").setTickFont(tick_font)
-        plot_item.getAxis("left").setTickFont(tick_font)
+        dark = self.settings.get("dark_mode", False)
+        plot_item.getViewBox().setBackgroundColor("k" if dark else "w")
+        self._style_axes(plot_item, dark)
+
+    def _style_axes(self, plot, dark: bool):
+        """
+        Set tick font, axis/text pens and grid of a PlotWidget or PlotItem.
+
+        Parameters
+        ----------
+        plot : pg.PlotWidget or pg.PlotItem
+            Target plot (both provide getAxis() and showGrid()).
+
+        dark : bool
+            Whether dark mode is active (white axes instead of black).
+        """
+        tick_font = self.get_scaled_font(9)
+        pen = _WHITE_PEN if dark else _BLACK_PEN
+        for ax in (plot.getAxis("bottom"), plot.getAxis("left")):
+            ax.setTickFont(tick_font)
+            ax.setTextPen(pen)
+            ax.setPen(pen)
 
         grid_alpha = (
             0.5 if self.settings.get("high_contrast") else self.settings["grid_alpha"]
         )
-
-        if self.settings.get("dark_mode", False):
-            plot_item.getViewBox().setBackgroundColor("k")
-            plot_item.getAxis("left").setTextPen("w")
-            plot_item.getAxis("left").setPen(pg.mkPen("w"))
-            plot_item.getAxis("bottom").setTextPen("w")
-            plot_item.getAxis("bottom").setPen(pg.mkPen("w"))
-            plot_item.showGrid(x=True, y=True, alpha=grid_alpha)
-        else:
-            plot_item.getViewBox().setBackgroundColor("w")
-            plot_item.getAxis("left").setTextPen("k")
-            plot_item.getAxis("left").setPen(pg.mkPen("k"))
-            plot_item.getAxis("bottom").setTextPen("k")
-            plot_item.getAxis("bottom").setPen(pg.mkPen("k"))
-            plot_item.showGrid(x=True, y=True, alpha=grid_alpha)
+        plot.showGrid(x=True, y=True, alpha=grid_alpha)
 
     # ---------------- Table helpers ----------------
     def apply_table_colors(self, table: QtWidgets.QTableWidget):
@@ -360,29 +544,10 @@ class AccessibilityManager(QtCore.QObject):
         widget : QtWidgets.QWidget
             Target widget.
         """
-        style = """
-            QWidget { background-color: white; color: black; }
-            QPushButton { background-color: #f0f0f0; border: 2px solid #333; padding: 6px; font-weight: bold; }
-            QPushButton:pressed { background-color: #e0e0e0; }
-            QLabel { color: black; font-weight: bold; }
-            QComboBox, QSpinBox, QDoubleSpinBox, QLineEdit {
-                background-color: white; border: 2px solid #333; font-weight: bold;
-            }
-            QTabWidget::pane { border: 1px solid #333; }
-            QTabBar::tab { background: #f0f0f0; color: black; padding: 6px; }
-            QTabBar::tab:selected { background: #ddd; }
-            QTabBar::tab:hover { background: #eee; }
-            QTableWidget, QTableView {
-                background-color: white; alternate-background-color: #f9f9f9;
-                color: black; gridline-color: #333;
-            }
-            QHeaderView::section {
-                background-color: #f0f0f0; color: black; border: 1px solid #333;
-            }
-        """
         if widget.property("_a11y_prev_stylesheet") is None:
             widget.setProperty("_a11y_prev_stylesheet", widget.styleSheet() or "")
-        widget.setStyleSheet(style)
+        if widget.styleSheet() != _HC_QSS:
+            widget.setStyleSheet(_HC_QSS)
 
     def apply_dark_mode_style(self, widget: QtWidgets.QWidget):
         """
@@ -393,40 +558,10 @@ class AccessibilityManager(QtCore.QObject):
         widget : QtWidgets.QWidget
             Target widget.
         """
-        style = """
-            QWidget { background-color: #121212; color: #f0f0f0; }
-            QPushButton { background-color: #333; border: 1px solid #555; padding: 6px; }
-            QPushButton:pressed { background-color: #444; }
-            QLabel { color: #f0f0f0; }
-            QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox {
-                background-color: #222; color: #f0f0f0; border: 1px solid #555;
-            }
-            QTabWidget::pane { border: 1px solid #444; }
-            QTabBar::tab { background: #333; color: #f0f0f0; padding: 6px; }
-            QTabBar::tab:selected { background: #555; }
-            QTabBar::tab:hover { background: #444; }
-            QTableWidget, QTableView {
-                background-color: #121212; alternate-background-color: #1e1e1e;
-                color: #f0f0f0; gridline-color: #444;
-                selection-background-color: #333366; selection-color: #ffffff;
-            }
-            QHeaderView::section {
-                background-color: #222; color: #f0f0f0; border: 1px solid #444;
-            }
-            QGroupBox {
-                border: 1px solid #444; margin-top: 6px;
-            }
-            QGroupBox:title {
-                subcontrol-origin: margin; left: 7px; padding: 0 3px 0 3px;
-                color: #f0f0f0;
-            }
-            QGraphicsView {
-                background-color: #121212; border: 1px solid #444;
-            }
-        """
         if widget.property("_a11y_prev_stylesheet") is None:
             widget.setProperty("_a11y_prev_stylesheet", widget.styleSheet() or "")
-        widget.setStyleSheet(style)
+        if widget.styleSheet() != _DARK_QSS:
+            widget.setStyleSheet(_DARK_QSS)
 
     def clear_styles(self, widget: QtWidgets.QWidget):
         """
@@ -481,11 +616,11 @@ class AccessibilityToolbar(QtWidgets.QWidget):
         acc_layout.addWidget(QtWidgets.QLabel("🔍 Font:"))
         self.font_combo = QtWidgets.QComboBox()
         self.font_combo.addItems(list(self.accessibility_manager.scale_options.keys()))
-        current_scale = self.accessibility_manager.settings["font_scale"]
-        for name, scale in self.accessibility_manager.scale_options.items():
-            if abs(scale - current_scale) < 0.01:
-                self.font_combo.setCurrentText(name)
-                break
+        name = self.accessibility_manager.scale_name(
+            self.accessibility_manager.settings["font_scale"]
+        )
+        if name is not None:
+            self.font_combo.setCurrentText(name)
         self.font_combo.currentTextChanged.connect(self.on_font_scale_changed)
         acc_layout.addWidget(self.font_combo)
 
@@ -531,10 +666,9 @@ class AccessibilityToolbar(QtWidgets.QWidget):
 
     def update_from_settings(self, settings: dict):
         """Update toolbar state from current settings."""
-        for name, scale in self.accessibility_manager.scale_options.items():
-            if abs(scale - settings["font_scale"]) < 0.01:
-                self.font_combo.setCurrentText(name)
-                break
+        name = self.accessibility_manager.scale_name(settings["font_scale"])
+        if name is not None:
+            self.font_combo.setCurrentText(name)
         self.high_contrast_btn.setChecked(settings["high_contrast"])
         self.dark_mode_btn.setChecked(settings["dark_mode"])
 
@@ -553,11 +687,17 @@ class AccessibleWidget(QtWidgets.QWidget):
         if not hasattr(app, "accessibility_manager"):
             app.accessibility_manager = AccessibilityManager()
         self.accessibility_manager = app.accessibility_manager
+        self._a11y_applied_version = -1  # Manager version last applied to this widget
         self.accessibility_manager.settings_changed.connect(self.on_accessibility_changed)
 
     def on_accessibility_changed(self, settings: dict):
         """Reapply accessibility settings when updated globally."""
+        self._apply_and_mark()
+
+    def _apply_and_mark(self):
+        """Apply current settings and remember which version was applied."""
         self.accessibility_manager.apply_to_widget(self)
+        self._a11y_applied_version = self.accessibility_manager._version
 
     def add_accessibility_toolbar(self, layout: QtWidgets.QLayout):
         """
@@ -578,11 +718,15 @@ class AccessibleWidget(QtWidgets.QWidget):
         return toolbar
 
     def showEvent(self, event):
-        """Apply accessibility settings after widget is shown."""
+        """
+        Apply accessibility settings after the widget is first shown.
+
+        Later shows (tab switches, re-docking) only re-apply if the settings
+        changed since the last apply.
+        """
         super().showEvent(event)
-        QtCore.QTimer.singleShot(
-            50, lambda: self.accessibility_manager.apply_to_widget(self)
-        )
+        if self._a11y_applied_version != self.accessibility_manager._version:
+            QtCore.QTimer.singleShot(0, self._apply_and_mark)
 
 
 def make_accessible(widget: QtWidgets.QWidget) -> AccessibilityManager:
@@ -645,26 +789,16 @@ class AccessibilityShortcuts(QtWidgets.QWidget):
     def increase_font(self):
         """Increase font size to the next larger scale."""
         current = self.accessibility_manager.settings["font_scale"]
-        scales = sorted(self.accessibility_manager.scale_options.values())
-        for s in scales:
-            if s > current + 0.01:
-                for name, val in self.accessibility_manager.scale_options.items():
-                    if abs(val - s) < 0.01:
-                        self.accessibility_manager.set_font_scale(name)
-                        return
+        name = self.accessibility_manager.next_scale_name(current)
+        if name is not None:
+            self.accessibility_manager.set_font_scale(name)
 
     def decrease_font(self):
         """Decrease font size to the next smaller scale."""
         current = self.accessibility_manager.settings["font_scale"]
-        scales = sorted(
-            self.accessibility_manager.scale_options.values(), reverse=True
-        )
-        for s in scales:
-            if s < current - 0.01:
-                for name, val in self.accessibility_manager.scale_options.items():
-                    if abs(val - s) < 0.01:
-                        self.accessibility_manager.set_font_scale(name)
-                        return
+        name = self.accessibility_manager.prev_scale_name(current)
+        if name is not None:
+            self.accessibility_manager.set_font_scale(name)
 
     def reset_font(self):
         """Reset font scale to 'Normal'."""
@@ -57,7 +57,8 @@ class MainWindow(QtWidgets.QWidget):
     params_tab : ParamsTab
         Tab for setting SXM parameters.
     step_tab : StepTestTab
-        Tab for executing step tests.
+        Tab for executing step tests. This and the tabs below are None until
+        initialize() has built them.
     scope_tab : ScopeTab
         Tab for plotting real-time signal traces.
     suggest_tab : SuggestedTab
@@ -74,9 +75,20 @@ class MainWindow(QtWidgets.QWidget):
         Toolbar with accessibility controls.
     """
 
+    # Titles of the tabs built lazily by initialize(), in tab order after "Parameters"
+    _LAZY_TAB_TITLES = (
+        "Step Test",
+        "Scope",
+        "Suggested Setup",
+        "QPlus Amplitude calibration",
+        "Constant Height",
+    )
+
     def __init__(self, conn):
         """
-        Initialize the main window and all functional tabs with accessibility support.
+        Initialize the main window and the Parameters tab with accessibility support.
+
+        The remaining tabs are built by initialize().
 
         Parameters
         ----------
@@ -108,30 +120,22 @@ class MainWindow(QtWidgets.QWidget):
         # Create tab widget
         self.tabs = QtWidgets.QTabWidget()
 
-        # Create all tabs, sharing the same connection handles
+        # Only the Parameters tab is built up front; the others start as
+        # placeholders and are created by initialize() (after the window is
+        # shown, or as soon as the user switches tab).
         self.params_tab = ParamsTab(conn.dde)
-        self.step_tab = StepTestTab(conn.dde)
-        self.scope_tab = ScopeTab()
-        self.suggest_tab = SuggestedTab(conn.dde, self.params_tab)
-        self.qplus_tab = QplusCalibrationTab(conn.dde)
-        self.topo_hold_tab = ZConstAcquisition(conn.dde, conn.driver)
-
-        # Link StepTest to Scope and Tabs
-        self.step_tab.scope_tab = self.scope_tab
-        self.step_tab.tabs_widget = self.tabs
-        self.step_tab.scope_tab_index = 2  # Tab order: 0=Parameters, 1=Step Test, 2=Scope, ...
-        self.scope_tab.set_test_tab_reference(self.step_tab)
-        
-        # Add tabs to UI
+        self.step_tab = None
+        self.scope_tab = None
+        self.suggest_tab = None
+        self.qplus_tab = None
+        self.topo_hold_tab = None
+        self._lazy_initialized = False
+
+        # Add tabs to UI (tab order: 0=Parameters, 1=Step Test, 2=Scope, ...)
         self.tabs.addTab(self.params_tab, "Parameters")
-        self.tabs.addTab(self.step_tab, "Step Test")
-        self.tabs.addTab(self.scope_tab, "Scope")
-        self.tabs.addTab(self.suggest_tab, "Suggested Setup")
-        self.tabs.addTab(self.qplus_tab, "QPlus Amplitude calibration")
-        self.tabs.addTab(self.topo_hold_tab, "Constant Height")
-
-        # Connect custom parameters from ParamsTab to StepTestTab
-        self.params_tab.custom_params_changed.connect(self.step_tab.set_custom_params)
+        for title in self._LAZY_TAB_TITLES:
+            self.tabs.addTab(QtWidgets.QWidget(), title)
+        self.tabs.currentChanged.connect(self._on_tab_changed)
 
         layout.addWidget(self.tabs)
 
@@ -151,6 +155,56 @@ class MainWindow(QtWidgets.QWidget):
         # Apply initial accessibility settings
         self.apply_accessibility_to_all_tabs()
 
+    def initialize(self):
+        """
+        Build the tabs that were deferred in __init__ and swap out their placeholders.
+
+        Safe to call more than once; only the first call does any work.
+        """
+        if self._lazy_initialized:
+            return
+        self._lazy_initialized = True
+        conn = self.conn
+
+        # Create the remaining tabs, sharing the same connection handles
+        self.step_tab = StepTestTab(conn.dde)
+        self.scope_tab = ScopeTab()
+        self.suggest_tab = SuggestedTab(conn.dde, self.params_tab)
+        self.qplus_tab = QplusCalibrationTab(conn.dde)
+        self.topo_hold_tab = ZConstAcquisition(conn.dde, conn.driver)
+
+        # Link StepTest to Scope and Tabs
+        self.step_tab.scope_tab = self.scope_tab
+        self.step_tab.tabs_widget = self.tabs
+        self.step_tab.scope_tab_index = 2  # Tab order: 0=Parameters, 1=Step Test, 2=Scope, ...
+        self.scope_tab.set_test_tab_reference(self.step_tab)
+
+        # Replace the placeholders in place, keeping the selected tab
+        current = self.tabs.currentIndex()
+        self.tabs.blockSignals(True)
+        widgets = (self.step_tab, self.scope_tab, self.suggest_tab, self.qplus_tab, self.topo_hold_tab)
+        for index, (title, widget) in enumerate(zip(self._LAZY_TAB_TITLES, widgets), start=1):
+            placeholder = self.tabs.widget(index)
+            self.tabs.removeTab(index)
+            self.tabs.insertTab(index, widget, title)
+            placeholder.deleteLater()
+        self.tabs.setCurrentIndex(current)
+        self.tabs.blockSignals(False)
+
+        # Connect custom parameters from ParamsTab to StepTestTab, including
+        # any that were added before the Step Test tab existed
+        self.params_tab.custom_params_changed.connect(self.step_tab.set_custom_params)
+        self.step_tab.set_custom_params([
+            (ptype, pcode, label) for (_k, ptype, pcode, label, _v) in self.params_tab._custom_params
+        ])
+
+        self.apply_accessibility_to_all_tabs()
+
+    def _on_tab_changed(self, index):
+        """Build the deferred tabs the first time the user leaves the Parameters tab."""
+        if index > 0:
+            self.initialize()
+
     def setup_accessibility(self):
         """Initialize accessibility features"""
         # Create or get global accessibility manager
@@ -259,16 +313,11 @@ class MainWindow(QtWidgets.QWidget):
     def increase_font_size(self):
         """Increase font size to next level"""
         current_scale = self.accessibility_manager.settings['font_scale']
-        scales = list(self.accessibility_manager.scale_options.values())
-        scales.sort()
-        
-        for scale in scales:
-            if scale > current_scale + 0.01:
-                for name, s in self.accessibility_manager.scale_options.items():
-                    if abs(s - scale) < 0.01:
-                        self.set_font_scale(name)
-                        self.show_font_change_feedback(name)
-                        return
+        name = self.accessibility_manager.next_scale_name(current_scale)
+        if name is not None:
+            self.set_font_scale(name)
+            self.show_font_change_feedback(name)
+            return
         
         # Already at maximum
         self.show_font_change_feedback("Already at maximum size")
@@ -276,16 +325,11 @@ class MainWindow(QtWidgets.QWidget):
     def decrease_font_size(self):
         """Decrease font size to previous level"""
         current_scale = self.accessibility_manager.settings['font_scale']
-        scales = list(self.accessibility_manager.scale_options.values())
-        scales.sort(reverse=True)
-        
-        for scale in scales:
-            if scale < current_scale - 0.01:
-                for name, s in self.accessibility_manager.scale_options.items():
-                    if abs(s - scale) < 0.01:
-                        self.set_font_scale(name)
-                        self.show_font_change_feedback(name)
-                        return
+        name = self.accessibility_manager.prev_scale_name(current_scale)
+        if name is not None:
+            self.set_font_scale(name)
+            self.show_font_change_feedback(name)
+            return
         
         # Already at minimum
         self.show_font_change_feedback("Already at minimum size")
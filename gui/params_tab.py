@@ -21,6 +21,7 @@ from PyQt5 import QtWidgets, QtCore, QtGui
 
 from ..common import (
     PARAMS_BASE,
+    PARAMS_BASE_ROW,
     PARAM_TOOLTIPS,
     _to_float,
     confirm_high_voltage,
@@ -56,6 +57,8 @@ class ParamsTab(QtWidgets.QWidget):
         super().__init__(parent)
         self.dde = dde
         self._custom_params: List[Tuple[str, str, object, str, bool]] = []
+        # Base + custom rows, rebuilt only when a custom parameter is added
+        self._params_all: Tuple[Tuple[str, str, object, str, bool], ...] = tuple(PARAMS_BASE)
 
         # --- Layout ---
         layout = QtWidgets.QVBoxLayout(self)
@@ -122,9 +125,9 @@ class ParamsTab(QtWidgets.QWidget):
         layout.addWidget(self.log_widget)
 
     # ---------- internal helpers ----------
-    def _all_params(self) -> List[Tuple[str, str, object, str, bool]]:
-        """Return base + custom parameters."""
-        return PARAMS_BASE + self._custom_params
+    def _all_params(self) -> Tuple[Tuple[str, str, object, str, bool], ...]:
+        """Return base + custom parameters (cached; do not mutate)."""
+        return self._params_all
 
     def _rebuild_table(self) -> None:
         """Rebuild the parameter table from the current parameter list."""
@@ -242,7 +245,9 @@ class ParamsTab(QtWidgets.QWidget):
                 )
                 return
 
-        self._custom_params.append((key, "EDIT", edit_code, label, voltage_like))
+        entry = (key, "EDIT", edit_code, label, voltage_like)
+        self._custom_params.append(entry)
+        self._params_all += (entry,)
         self._rebuild_table()
 
     # ---------- apply operations ----------
@@ -272,6 +277,8 @@ class ParamsTab(QtWidgets.QWidget):
         if voltage_like and not confirm_high_voltage(self, label, value):
             return
 
+        # Explicit Apply always reaches SXM: it is write-only, so the value may
+        # have been changed there since our last write.
         try:
             if ptype == "EDIT":
                 self.dde.send_scanpara(str(pcode), value)
@@ -402,10 +409,9 @@ class ParamsTab(QtWidgets.QWidget):
                         stage_row(row, float(val))
                         staged += 1
         elif isinstance(payload, dict):
-            base_index = {k: i for i, (k, *_r) in enumerate(PARAMS_BASE)}
             for key, val in payload.items():
-                if key in base_index and isinstance(val, (int, float)):
-                    row = base_index[key]
+                row = PARAMS_BASE_ROW.get(key)
+                if row is not None and isinstance(val, (int, float)):
                     stage_row(row, float(val))
                     staged += 1
 
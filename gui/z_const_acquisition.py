@@ -244,6 +244,8 @@ class ZConstAcquisition(QtWidgets.QWidget):
 
         self.dde = dde
         self.driver = driver
+        # Pre-resolved Topo reader for the poll timer (no per-tick name lookup)
+        self._read_topo = driver.reader("Topo") if driver is not None else None
         self.live_mode = True
 
         # state
@@ -478,7 +480,7 @@ class ZConstAcquisition(QtWidgets.QWidget):
 
         try:
             if self.live_mode and self.driver:
-                z = self.driver.read_scaled("Topo")
+                z = self._read_topo()
                 change = z - self.previous_z
                 self.previous_z = self.last_z
                 self.last_z = z
@@ -492,7 +494,7 @@ class ZConstAcquisition(QtWidgets.QWidget):
             else:
                 # manual mode: read for plot only; do not touch spinbox
                 if self.driver:
-                    z = self.driver.read_scaled("Topo")
+                    z = self._read_topo()
                     self.last_z = z
                 else:
                     z = self.last_z